@@ -1,17 +1,117 @@
 """Benchmark suite for measuring Bitcask key-value store performance."""
 
 # -*- coding: utf-8 -*-
-import json
-import random
-import shutil
-import statistics
+import argparse
+import functools
+import os
 import string
+import threading
 import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import AbstractSet, Any, Callable, Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+import orjson
+import psutil
 
 from pybitcask import Bitcask
 
+# Number of operations timed together by a single pair of clock reads
+TIMING_BLOCK_SIZE = 10
+
+# Phases timed by run_benchmark, in the order their statistics are reported
+BENCHMARK_PHASES = (
+    "write_times",
+    "sequential_read_times",
+    "random_read_times",
+    "delete_times",
+    "batch_write_times",
+)
+
+# Phases whose samples are TIMING_BLOCK_SIZE-operation block averages rather
+# than single operations. Their spread is about sqrt(TIMING_BLOCK_SIZE) times
+# narrower, so it is reported as *_block_std, *_block_min and *_block_max
+# instead of under the per-operation names
+BLOCK_TIMED_PHASES = frozenset(
+    ("write_times", "sequential_read_times", "random_read_times", "delete_times")
+)
+
+# Phases timed by run_benchmark_interleaved, in the order they run per key
+INTERLEAVED_PHASES = (
+    "interleaved_write_times",
+    "interleaved_read_times",
+    "interleaved_delete_times",
+)
+
+# Seed for the random read order, so that phase is reproducible across runs
+RANDOM_READ_SEED = 0
+
+# Length of the random keys produced by generate_random_data
+KEY_SIZE = 10
+
+
+def _fast_rmtree(path: Path, ignore_errors: bool = False) -> None:
+    """Recursively delete a directory tree.
+
+    Uses ``os.scandir`` so file types come from the cached directory entry,
+    avoiding the extra ``lstat`` per entry that ``shutil.rmtree`` performs.
+
+    Args:
+    ----
+        path: The directory to delete
+        ignore_errors: If True, errors while deleting are ignored
+
+    """
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    _fast_rmtree(entry.path, ignore_errors)
+                else:
+                    os.unlink(entry.path)
+        os.rmdir(path)
+    except OSError:
+        if not ignore_errors:
+            raise
+
+
+def _remove_trees(paths: List[Path]) -> None:
+    """Delete directory trees, ignoring errors.
+
+    Args:
+    ----
+        paths: The directories to delete
+
+    """
+    for path in paths:
+        _fast_rmtree(path, ignore_errors=True)
+
+
+def _reset_dir(path: Path) -> None:
+    """Replace a directory with a fresh, empty one.
+
+    An existing directory is renamed aside and deleted on a background thread,
+    so the caller does not wait for its contents to be removed. Leftovers of
+    earlier runs that were interrupted mid-delete are removed along with it.
+
+    Args:
+    ----
+        path: The directory to reset
+
+    """
+    trash_dirs = list(path.parent.glob(f"{path.name}.trash.*"))
+    if path.exists():
+        trash = path.with_name(f"{path.name}.trash.{uuid.uuid4().hex}")
+        os.rename(path, trash)
+        trash_dirs.append(trash)
+    if trash_dirs:
+        # Not a daemon thread: the interpreter waits for it before exiting, so
+        # a short run cannot leave a half-deleted directory behind
+        threading.Thread(target=_remove_trees, args=(trash_dirs,)).start()
+    path.mkdir(parents=True, exist_ok=True)
+
 
 class BenchmarkBase:
     """Base class for benchmark implementations."""
@@ -23,20 +123,21 @@ class BenchmarkBase:
 
     def setup(self):
         """Set up the benchmark environment."""
-        if self.data_dir.exists():
-            shutil.rmtree(self.data_dir)
-        self.data_dir.mkdir(exist_ok=True)
+        _reset_dir(self.data_dir)
 
     def cleanup(self):
         """Clean up the benchmark environment."""
         if self.db:
             self.db.close()
         if self.data_dir.exists():
-            shutil.rmtree(self.data_dir)
+            _fast_rmtree(self.data_dir)
 
-    def generate_data(self, size: int, value_size: int) -> Dict[str, str]:
+    def generate_data(self, size: int, value_size: int) -> Iterator[Tuple[str, bytes]]:
         """Generate test data for benchmarking.
 
+        Keys are produced on demand and all pairs share a single value buffer,
+        so memory use does not grow with ``size``.
+
         Args:
         ----
             size: Number of key-value pairs to generate
@@ -44,10 +145,11 @@ class BenchmarkBase:
 
         Returns:
         -------
-            Dictionary containing test data
+            Iterator over (key, value) pairs
 
         """
-        return {f"key{i}": "x" * value_size for i in range(size)}
+        value = b"x" * value_size
+        return ((f"key{i}", value) for i in range(size))
 
 
 class PyBitcaskEngine:
@@ -66,15 +168,19 @@ class PyBitcaskEngine:
         self.db = None
 
     def setup(self):
-        """Set up the Bitcask instance."""
-        self.db = Bitcask(self.path)
+        """Set up the Bitcask instance.
+
+        Writes are not fsynced individually; the benchmark calls sync() between
+        phases so per-operation timings measure the engine, not the disk.
+        """
+        self.db = Bitcask(self.path, sync="manual")
 
     def teardown(self):
         """Clean up the Bitcask instance."""
         if self.db:
             self.db.close()
 
-    def put(self, key: str, value: str):
+    def put(self, key: str, value: bytes):
         """Store a key-value pair.
 
         Args:
@@ -85,7 +191,7 @@ class PyBitcaskEngine:
         """
         self.db.put(key, value)
 
-    def get(self, key: str) -> str:
+    def get(self, key: str) -> bytes:
         """Retrieve a value by key.
 
         Args:
@@ -109,13 +215,27 @@ class PyBitcaskEngine:
         """
         self.db.delete(key)
 
+    def sync(self):
+        """Flush all pending writes to disk."""
+        self.db.sync()
+
+    def put_many(self, items: List[Tuple[str, bytes]]):
+        """Store a batch of key-value pairs with a single write.
+
+        Args:
+        ----
+            items: List of (key, value) pairs to store
+
+        """
+        self.db.batch_write(dict(items))
+
 
 class BitcaskBenchmark:
     """Benchmark class for measuring Bitcask performance metrics."""
 
     def __init__(self):
         """Initialize benchmark configuration and setup test data."""
-        self.data_dir = "benchmark_data"
+        self.data_dir = Path("benchmark_data")
         self.db = None
         self.data_sizes = [100, 1000, 10000]
         self.value_sizes = [64, 256, 1024]  # in bytes
@@ -123,9 +243,7 @@ class BitcaskBenchmark:
     def setup(self):
         """Set up the benchmark environment."""
         # Clean up any existing data
-        if self.data_dir.exists():
-            shutil.rmtree(self.data_dir)
-        self.data_dir.mkdir(exist_ok=True)
+        _reset_dir(self.data_dir)
 
         # Initialize the database
         self.db = Bitcask(str(self.data_dir))
@@ -135,78 +253,71 @@ class BitcaskBenchmark:
         self.db.close()
         self.db = None
 
-    def generate_data(self, size: int, value_size: int) -> Dict[str, str]:
+    def generate_data(self, size: int, value_size: int) -> Iterator[Tuple[str, bytes]]:
         """Generate test data for benchmarking.
 
-        Args:
-        ----
-            size: Number of key-value pairs to generate
-            value_size: Size of each value in bytes
-
-        Returns:
-        -------
-            Dictionary containing test data
-
-        """
-        return {f"key{i}": "x" * value_size for i in range(size)}
-
-    def run_write_benchmark(self, size: int, value_size: int) -> float:
-        """Run write operation benchmark.
+        Keys are produced on demand and all pairs share a single value buffer,
+        so memory use does not grow with ``size``.
 
         Args:
         ----
-            size: Number of key-value pairs to write
+            size: Number of key-value pairs to generate
             value_size: Size of each value in bytes
 
         Returns:
         -------
-            Average time per operation in seconds
+            Iterator over (key, value) pairs
 
         """
-        data = self.generate_data(size, value_size)
-        self.db = Bitcask(self.data_dir)
-
-        start_time = time.time()
-        for key, value in data.items():
-            self.db.put(key, value)
-        end_time = time.time()
+        value = b"x" * value_size
+        return ((f"key{i}", value) for i in range(size))
 
-        self.db.close()
-        return (end_time - start_time) / size
+    def run_point(self, size: int, value_size: int) -> Tuple[float, float]:
+        """Run the write and read benchmarks against one populated database.
 
-    def run_read_benchmark(self, size: int, value_size: int) -> float:
-        """Run read operation benchmark.
+        The database is reset first, then the keys written during the write
+        phase are read back through the same handle, so both timings refer to
+        a single dataset of ``size`` keys.
 
         Args:
         ----
-            size: Number of key-value pairs to read
+            size: Number of key-value pairs to write and read
             value_size: Size of each value in bytes
 
         Returns:
         -------
-            Average time per operation in seconds
+            Tuple of (average write time, average read time) per operation
+            in seconds
 
         """
-        data = self.generate_data(size, value_size)
+        self.setup()
         self.db = Bitcask(self.data_dir)
 
-        # Write data first
-        for key, value in data.items():
+        # Benchmark writes
+        keys = []
+        start_time = time.time()
+        for key, value in self.generate_data(size, value_size):
             self.db.put(key, value)
+            keys.append(key)
+        write_time = (time.time() - start_time) / size
 
         # Benchmark reads
         start_time = time.time()
-        for key in data.keys():
+        for key in keys:
             self.db.get(key)
-        end_time = time.time()
+        read_time = (time.time() - start_time) / size
 
         self.db.close()
-        return (end_time - start_time) / size
+        self.db = None
+        return write_time, read_time
 
 
-def generate_random_data(size: int, value_size: int = 100) -> List[Tuple[str, str]]:
+def generate_random_data(size: int, value_size: int = 100) -> List[Tuple[str, bytes]]:
     """Generate random key-value pairs for testing.
 
+    Values are produced as ``bytes`` up front so the timed loops hand
+    pre-built buffers to the engine without any per-operation encoding.
+
     Args:
     ----
         size: Number of key-value pairs to generate
@@ -217,18 +328,72 @@ def generate_random_data(size: int, value_size: int = 100) -> List[Tuple[str, st
         List of (key, value) tuples
 
     """
+    alphabet = np.frombuffer(
+        (string.ascii_letters + string.digits).encode("ascii"), dtype=np.uint8
+    )
+    row_size = KEY_SIZE + value_size
+    indices = np.random.randint(0, len(alphabet), size=size * row_size, dtype=np.uint8)
+    buffer = alphabet[indices].tobytes()
+
     data = []
-    for _ in range(size):
-        key = "".join(random.choices(string.ascii_letters + string.digits, k=10))
-        value = "".join(
-            random.choices(string.ascii_letters + string.digits, k=value_size)
-        )
+    for offset in range(0, size * row_size, row_size):
+        key = buffer[offset : offset + KEY_SIZE].decode("ascii")
+        value = buffer[offset + KEY_SIZE : offset + row_size]
         data.append((key, value))
     return data
 
 
+@functools.lru_cache(maxsize=None)
+def _random_order(operations: int) -> np.ndarray:
+    """Get the order in which the random read phase visits the keys.
+
+    The permutation is seeded, so it is the same for every grid point with the
+    same number of operations and is computed only once per process.
+
+    Args:
+    ----
+        operations: Number of keys to permute
+
+    Returns:
+    -------
+        Read-only array of key indices
+
+    """
+    order = np.random.default_rng(RANDOM_READ_SEED).permutation(operations)
+    order.flags.writeable = False
+    return order
+
+
+def _time_blocks(
+    op: Callable[..., Any],
+    args: Sequence[Tuple[Any, ...]],
+    out: np.ndarray,
+    block_size: int = TIMING_BLOCK_SIZE,
+) -> None:
+    """Time an operation over a sequence of arguments in fixed-size blocks.
+
+    Reading the clock once per block rather than once per operation keeps the
+    timer overhead out of sub-microsecond measurements.
+
+    Args:
+    ----
+        op: The operation to call
+        args: Positional arguments for each call
+        out: Array receiving the average time per operation, in seconds,
+            for each block
+        block_size: Number of calls timed together
+
+    """
+    for j, i in enumerate(range(0, len(args), block_size)):
+        block = args[i : i + block_size]
+        start = time.perf_counter_ns()
+        for call_args in block:
+            op(*call_args)
+        out[j] = (time.perf_counter_ns() - start) / len(block) / 1e9
+
+
 def run_benchmark(
-    engine: PyBitcaskEngine, data: List[Tuple[str, str]], operations: int = 1000
+    engine: PyBitcaskEngine, data: List[Tuple[str, bytes]], operations: int = 1000
 ) -> Dict[str, float]:
     """Run benchmark tests on pybitcask.
 
@@ -243,68 +408,128 @@ def run_benchmark(
         Dictionary of benchmark results
 
     """
-    results = {
-        "write_times": [],
-        "read_times": [],
-        "delete_times": [],
-        "batch_write_times": [],
-        "sequential_read_times": [],
-        "random_read_times": [],
-    }
+    # One row of per-block timings per phase; phases with fewer blocks than
+    # the widest one leave their trailing entries as NaN
+    timings = np.full(
+        (len(BENCHMARK_PHASES), -(-operations // TIMING_BLOCK_SIZE)), np.nan
+    )
+    rows = {phase: timings[i] for i, phase in enumerate(BENCHMARK_PHASES)}
 
     # Setup
     engine.setup()
+    items = data[:operations]
+    keys = [(key,) for key, _ in items]
 
     print("\nRunning Write Benchmark...")
     # Write benchmark
-    for key, value in data[:operations]:
-        start = time.perf_counter()
-        engine.put(key, value)
-        results["write_times"].append(time.perf_counter() - start)
+    _time_blocks(engine.put, items, rows["write_times"])
+    engine.sync()
 
     print("Running Read Benchmark...")
     # Read benchmark (sequential)
-    for key, _ in data[:operations]:
-        start = time.perf_counter()
-        engine.get(key)
-        results["sequential_read_times"].append(time.perf_counter() - start)
+    _time_blocks(engine.get, keys, rows["sequential_read_times"])
 
     print("Running Random Read Benchmark...")
     # Random read benchmark
-    random_keys = random.sample([key for key, _ in data[:operations]], operations)
-    for key in random_keys:
-        start = time.perf_counter()
-        engine.get(key)
-        results["random_read_times"].append(time.perf_counter() - start)
+    random_keys = [keys[i] for i in _random_order(operations)]
+    _time_blocks(engine.get, random_keys, rows["random_read_times"])
 
     print("Running Delete Benchmark...")
     # Delete benchmark
-    for key, _ in data[:operations]:
-        start = time.perf_counter()
-        engine.delete(key)
-        results["delete_times"].append(time.perf_counter() - start)
+    _time_blocks(engine.delete, keys, rows["delete_times"])
+    engine.sync()
 
     # Batch write benchmark
     print("Running Batch Write Benchmark...")
     batch_size = 100
-    for i in range(0, operations, batch_size):
+    batch_write_times = rows["batch_write_times"]
+    for j, i in enumerate(range(0, operations, batch_size)):
         batch_data = data[i : i + batch_size]
-        start = time.perf_counter()
-        for key, value in batch_data:
-            engine.put(key, value)
-        results["batch_write_times"].append((time.perf_counter() - start) / batch_size)
+        start = time.perf_counter_ns()
+        engine.put_many(batch_data)
+        batch_write_times[j] = (time.perf_counter_ns() - start) / batch_size / 1e9
 
     # Teardown
     engine.teardown()
 
-    # Calculate statistics
+    return _summarize(BENCHMARK_PHASES, timings, BLOCK_TIMED_PHASES)
+
+
+def run_benchmark_interleaved(
+    engine: PyBitcaskEngine, data: List[Tuple[str, bytes]], operations: int = 1000
+) -> Dict[str, float]:
+    """Run put, get and delete back to back on each key in a single pass.
+
+    Unlike run_benchmark, which makes a full pass over the data per phase, the
+    key and value stay hot in the CPU caches across the three operations.
+
+    Args:
+    ----
+        engine: The Bitcask engine to test
+        data: List of (key, value) pairs to use
+        operations: Number of operations to perform
+
+    Returns:
+    -------
+        Dictionary of benchmark results
+
+    """
+    items = data[:operations]
+    timings = np.empty((len(INTERLEAVED_PHASES), len(items)), dtype=np.int64)
+
+    # Setup
+    engine.setup()
+
+    print("\nRunning Interleaved Benchmark...")
+    for i, (key, value) in enumerate(items):
+        t0 = time.perf_counter_ns()
+        engine.put(key, value)
+        t1 = time.perf_counter_ns()
+        engine.get(key)
+        t2 = time.perf_counter_ns()
+        engine.delete(key)
+        t3 = time.perf_counter_ns()
+        timings[0, i] = t1 - t0
+        timings[1, i] = t2 - t1
+        timings[2, i] = t3 - t2
+
+    # Teardown
+    engine.teardown()
+
+    return _summarize(INTERLEAVED_PHASES, timings / 1e9)
+
+
+def _summarize(
+    phases: Sequence[str],
+    timings: np.ndarray,
+    block_phases: AbstractSet[str] = frozenset(),
+) -> Dict[str, float]:
+    """Calculate statistics for all phases at once.
+
+    Args:
+    ----
+        phases: Phase names, one per row of ``timings``
+        timings: Timings in seconds; NaN entries are ignored
+        block_phases: Phases whose timings are block averages; their standard
+            deviation, minimum and maximum get a ``_block`` infix
+
+    Returns:
+    -------
+        Dictionary of average, standard deviation, minimum and maximum per phase
+
+    """
+    means = np.nanmean(timings, axis=1)
+    stds = np.nanstd(timings, axis=1, ddof=1)
+    mins = np.nanmin(timings, axis=1)
+    maxs = np.nanmax(timings, axis=1)
+
     stats = {}
-    for op_type, times in results.items():
-        if times:  # Only calculate if we have data
-            stats[f"{op_type}_avg"] = statistics.mean(times)
-            stats[f"{op_type}_std"] = statistics.stdev(times)
-            stats[f"{op_type}_min"] = min(times)
-            stats[f"{op_type}_max"] = max(times)
+    for i, op_type in enumerate(phases):
+        spread = f"{op_type}_block" if op_type in block_phases else op_type
+        stats[f"{op_type}_avg"] = float(means[i])
+        stats[f"{spread}_std"] = float(stds[i])
+        stats[f"{spread}_min"] = float(mins[i])
+        stats[f"{spread}_max"] = float(maxs[i])
 
     return stats
 
@@ -328,68 +553,144 @@ def run_benchmarks() -> Dict[str, List[Dict[str, Any]]]:
 
     for size in benchmark.data_sizes:
         for value_size in benchmark.value_sizes:
-            # Run write benchmark
-            write_time = benchmark.run_write_benchmark(size, value_size)
+            write_time, read_time = benchmark.run_point(size, value_size)
             results["write"].append(
                 {"data_size": size, "value_size": value_size, "time": write_time}
             )
-
-            # Run read benchmark
-            read_time = benchmark.run_read_benchmark(size, value_size)
             results["read"].append(
                 {"data_size": size, "value_size": value_size, "time": read_time}
             )
 
-            # Clean up between runs
-            benchmark.setup()
-
     return results
 
 
+def _run_point(
+    data_size: int, value_size: int, operations: int, interleaved: bool = False
+) -> Tuple[str, Dict[str, Any]]:
+    """Run the benchmark for a single point of the configuration grid.
+
+    Args:
+    ----
+        data_size: Number of key-value pairs to generate
+        value_size: Size of each value in bytes
+        operations: Maximum number of operations to perform
+        interleaved: If True, also run the single-pass interleaved benchmark
+
+    Returns:
+    -------
+        Tuple of (configuration name, result entry)
+
+    """
+    msg = f"\nRunning benchmark with data_size={data_size}, \
+    value_size={value_size}"
+    print(msg)
+
+    # Generate test data
+    data = generate_random_data(data_size, value_size)
+
+    # Run benchmarks
+    db_path = f"benchmarks/data/pybitcask_{data_size}_{value_size}"
+    engine = PyBitcaskEngine(db_path)
+    results = run_benchmark(engine, data, min(operations, data_size))
+    if interleaved:
+        engine = PyBitcaskEngine(f"{db_path}_interleaved")
+        results.update(
+            run_benchmark_interleaved(engine, data, min(operations, data_size))
+        )
+
+    return f"size_{data_size}_value_{value_size}", {
+        "data_size": data_size,
+        "value_size": value_size,
+        "operations": min(operations, data_size),
+        "metrics": results,
+    }
+
+
+def _profile_point(data_size: int, value_size: int, operations: int) -> Path:
+    """Run a single grid point under cProfile and dump the stats.
+
+    Args:
+    ----
+        data_size: Number of key-value pairs to generate
+        value_size: Size of each value in bytes
+        operations: Maximum number of operations to perform
+
+    Returns:
+    -------
+        Path of the dumped profile, sorted by cumulative time
+
+    """
+    import cProfile
+    import pstats
+
+    data = generate_random_data(data_size, value_size)
+    engine = PyBitcaskEngine(
+        f"benchmarks/data/pybitcask_profile_{data_size}_{value_size}"
+    )
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    run_benchmark(engine, data, min(operations, data_size))
+    profiler.disable()
+
+    path = Path(f"benchmarks/results/profile_{data_size}_{value_size}.prof")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    stats = pstats.Stats(profiler).sort_stats("cumulative")
+    stats.dump_stats(path)
+    stats.print_stats(20)
+    return path
+
+
 def main():
     """Run the benchmark suite and save results."""
+    parser = argparse.ArgumentParser(description="PyBitcask benchmark suite")
+    parser.add_argument(
+        "--interleaved",
+        action="store_true",
+        help="Also run put/get/delete interleaved per key in a single pass",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs=2,
+        type=int,
+        metavar=("DATA_SIZE", "VALUE_SIZE"),
+        help="Profile a single grid point with cProfile instead of the full suite",
+    )
+    args = parser.parse_args()
+
     # Configuration
     data_sizes = [1000, 10000, 100000]
     value_sizes = [100, 1000, 10000]  # Different value sizes in bytes
     operations = 1000
 
     # Clean up old benchmark data
-    benchmark_data_dir = Path("benchmarks/data")
-    if benchmark_data_dir.exists():
-        shutil.rmtree(benchmark_data_dir)
-    benchmark_data_dir.mkdir(parents=True, exist_ok=True)
+    _reset_dir(Path("benchmarks/data"))
 
-    all_results = {}
-
-    for data_size in data_sizes:
-        for value_size in value_sizes:
-            msg = f"\nRunning benchmark with data_size={data_size}, \
-            value_size={value_size}"
-            print(msg)
-
-            # Generate test data
-            data = generate_random_data(data_size, value_size)
+    if args.profile:
+        path = _profile_point(*args.profile, operations)
+        print(f"\nProfile written to {path}")
+        return
 
-            # Run benchmarks
-            db_path = f"benchmarks/data/pybitcask_{data_size}_{value_size}"
-            engine = PyBitcaskEngine(db_path)
-            results = run_benchmark(engine, data, min(operations, data_size))
+    grid = [
+        (data_size, value_size, operations, args.interleaved)
+        for data_size in data_sizes
+        for value_size in value_sizes
+    ]
 
-            # Store results
-            all_results[f"size_{data_size}_value_{value_size}"] = {
-                "data_size": data_size,
-                "value_size": value_size,
-                "operations": min(operations, data_size),
-                "metrics": results,
-            }
+    # Each grid point uses its own data directory, so points run independently
+    all_results = {}
+    with ProcessPoolExecutor(max_workers=psutil.cpu_count(logical=False)) as pool:
+        for config_name, result in pool.map(_run_point, *zip(*grid)):
+            all_results[config_name] = result
 
     # Save results
     Path("benchmarks/results").mkdir(parents=True, exist_ok=True)
-    with open("benchmarks/results/benchmark_results.json", "w") as f:
-        json.dump(all_results, f, indent=2)
+    with open("benchmarks/results/benchmark_results.json", "wb") as f:
+        f.write(orjson.dumps(all_results, option=orjson.OPT_INDENT_2))
 
     # Print summary
     print("\nBenchmark Results Summary:")
+    print(f"(± of single-key phases is over {TIMING_BLOCK_SIZE}-operation blocks)")
     print("=" * 80)
     for config, results in all_results.items():
         print(f"\nConfiguration: {config}")
@@ -400,15 +701,15 @@ def main():
         )
         print(
             f"Sequential Write: {metrics['write_times_avg']:.6f} ± "
-            f"{metrics['write_times_std']:.6f} seconds"
+            f"{metrics['write_times_block_std']:.6f} seconds"
         )
         print(
             f"Sequential Read:  {metrics['sequential_read_times_avg']:.6f} ± "
-            f"{metrics['sequential_read_times_std']:.6f} seconds"
+            f"{metrics['sequential_read_times_block_std']:.6f} seconds"
         )
         print(
             f"Random Read:     {metrics['random_read_times_avg']:.6f} ± "
-            f"{metrics['random_read_times_std']:.6f} seconds"
+            f"{metrics['random_read_times_block_std']:.6f} seconds"
         )
         print(
             f"Batch Write:     {metrics['batch_write_times_avg']:.6f} ± "
@@ -416,8 +717,15 @@ def main():
         )
         print(
             f"Delete:          {metrics['delete_times_avg']:.6f} ± "
-            f"{metrics['delete_times_std']:.6f} seconds"
+            f"{metrics['delete_times_block_std']:.6f} seconds"
         )
+        if "interleaved_write_times_avg" in metrics:
+            print(
+                f"Interleaved Write/Read/Delete: "
+                f"{metrics['interleaved_write_times_avg']:.6f} / "
+                f"{metrics['interleaved_read_times_avg']:.6f} / "
+                f"{metrics['interleaved_delete_times_avg']:.6f} seconds"
+            )
 
 
 if __name__ == "__main__":
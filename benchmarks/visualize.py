@@ -1,26 +1,64 @@
 """Visualization module for Bitcask benchmark results."""
 
 # -*- coding: utf-8 -*-
+import argparse
+import functools
 import json
 import os
 import platform
-from typing import Any, Dict, List
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
 
-import matplotlib.pyplot as plt
-import pandas as pd
-import psutil
-import seaborn as sns
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+import seaborn as sns  # noqa: E402
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; fall back to parsing the whole file
+    ijson = None
+
+RESULTS_FILE = "benchmarks/results/results.json"
+
+
+# System information rarely changes, so it is cached between runs
+SYSINFO_CACHE = "benchmarks/results/.sysinfo.json"
+SYSINFO_TTL_SECONDS = 24 * 60 * 60
 
 
 def get_system_info() -> Dict[str, str]:
     """Get system configuration information.
 
+    The result is cached in ``SYSINFO_CACHE`` and reused while the cache is
+    younger than ``SYSINFO_TTL_SECONDS``.
+
     Returns
     -------
         Dictionary containing system information
 
     """
-    return {
+    try:
+        if time.time() - os.path.getmtime(SYSINFO_CACHE) < SYSINFO_TTL_SECONDS:
+            with open(SYSINFO_CACHE) as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    import psutil
+
+    info = {
         "OS": platform.system() + " " + platform.release(),
         "Python": platform.python_version(),
         "Processor": platform.processor(),
@@ -29,6 +67,14 @@ def get_system_info() -> Dict[str, str]:
         "CPU Threads": str(psutil.cpu_count(logical=True)),
     }
 
+    # Write to a temporary file and rename it so readers never see a partial file
+    os.makedirs(os.path.dirname(SYSINFO_CACHE), exist_ok=True)
+    tmp_path = f"{SYSINFO_CACHE}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(info, f)
+    os.replace(tmp_path, SYSINFO_CACHE)
+    return info
+
 
 def load_results() -> Dict[str, List[Dict[str, Any]]]:
     """Load benchmark results from file.
@@ -38,7 +84,9 @@ def load_results() -> Dict[str, List[Dict[str, Any]]]:
         Dictionary containing benchmark results
 
     """
-    with open("benchmarks/results/results.json") as f:
+    with open(RESULTS_FILE, "rb") as f:
+        if orjson is not None:
+            return orjson.loads(f.read())
         return json.load(f)
 
 
@@ -54,127 +102,319 @@ def create_dataframe(results: Dict[str, List[Dict[str, Any]]]) -> pd.DataFrame:
         DataFrame with processed benchmark data
 
     """
-    data = []
-    for operation, measurements in results.items():
+    operations = list(results)
+    counts = [len(measurements) for measurements in results.values()]
+    n = sum(counts)
+
+    # Fill one preallocated array per column in a single pass
+    data_size = np.empty(n, dtype=np.int32)
+    value_size = np.empty(n, dtype=np.int64)
+    times = np.empty(n, dtype=np.float64)
+    i = 0
+    for measurements in results.values():
         for measurement in measurements:
-            data.append(
-                {
-                    "operation": operation,
-                    "data_size": measurement["data_size"],
-                    "value_size": measurement["value_size"],
-                    "time": measurement["time"],
-                }
-            )
-    return pd.DataFrame(data)
-
-
-def plot_operation_times(df: pd.DataFrame, operation: str, output_dir: str):
+            data_size[i] = measurement["data_size"]
+            value_size[i] = measurement["value_size"]
+            times[i] = measurement["time"]
+            i += 1
+
+    codes = np.repeat(np.arange(len(operations)), counts)
+    return _build_dataframe(operations, codes, data_size, value_size, times)
+
+
+def load_dataframe() -> pd.DataFrame:
+    """Load benchmark results from file straight into a DataFrame.
+
+    When ijson is installed the file is parsed incrementally into compact
+    column buffers, so the parsed JSON document is never held in memory.
+
+    Returns
+    -------
+        DataFrame with processed benchmark data
+
+    """
+    if ijson is None:
+        return create_dataframe(load_results())
+
+    operations: Dict[str, int] = {}
+    code = -1
+    codes = array("q")
+    columns = {"data_size": array("i"), "value_size": array("q"), "time": array("d")}
+    with open(RESULTS_FILE, "rb") as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if event == "map_key" and prefix == "":
+                code = operations.setdefault(value, len(operations))
+            elif event == "start_map" and prefix.endswith(".item"):
+                codes.append(code)
+            elif event == "number":
+                column = columns.get(prefix.rpartition(".")[2])
+                if column is not None:
+                    column.append(value)
+
+    return _build_dataframe(
+        list(operations),
+        np.frombuffer(codes, dtype=np.int64),
+        *(np.frombuffer(column, dtype=column.typecode) for column in columns.values()),
+    )
+
+
+def _build_dataframe(
+    operations: List[str],
+    codes: np.ndarray,
+    data_size: np.ndarray,
+    value_size: np.ndarray,
+    times: np.ndarray,
+) -> pd.DataFrame:
+    """Assemble the benchmark DataFrame from its column arrays.
+
+    Args:
+    ----
+        operations: Operation names, indexed by ``codes``
+        codes: Operation code of each measurement
+        data_size: Data size of each measurement
+        value_size: Value size of each measurement
+        times: Time per operation of each measurement
+
+    Returns:
+    -------
+        DataFrame with processed benchmark data
+
+    """
+    return pd.DataFrame(
+        {
+            # Few distinct operations: store them as integer category codes
+            "operation": pd.Categorical.from_codes(codes, categories=operations),
+            "data_size": data_size.astype(np.int32, copy=False),
+            # Only a handful of distinct value sizes, used as plot groups
+            "value_size": pd.Categorical(value_size),
+            "time": times.astype(np.float64, copy=False),
+        }
+    )
+
+
+def _plot_arrays(
+    data_size: np.ndarray, value_size: np.ndarray, times: np.ndarray
+) -> Tuple[Tuple[int, np.ndarray, np.ndarray], ...]:
+    """Split plot columns into one (x, y) series per value size.
+
+    Args:
+    ----
+        data_size: Data size of each measurement
+        value_size: Value size of each measurement
+        times: Time per operation of each measurement
+
+    Returns:
+    -------
+        Tuple of (value size, data sizes, times), ordered by value size
+
+    """
+    order = np.argsort(value_size, kind="stable")
+    values, starts = np.unique(value_size[order], return_index=True)
+    xs = np.split(data_size[order], starts[1:])
+    ys = np.split(times[order], starts[1:])
+    return tuple(zip(values.tolist(), xs, ys))
+
+
+def plot_operation_times(
+    operation_data: pd.DataFrame,
+    operation: str,
+    ax: plt.Axes,
+    output_dir: str,
+    dpi: int = 100,
+):
     """Plot operation times for different data sizes.
 
     Args:
     ----
-        df: DataFrame containing benchmark data
+        operation_data: DataFrame containing the benchmark data of one operation
         operation: Operation type to plot
+        ax: Axes to draw on; cleared before plotting so it can be reused
         output_dir: Directory to save the plot
+        dpi: Resolution of the saved image
 
     """
-    operation_data = df[df["operation"] == operation]
-    plt.figure(figsize=(10, 6))
-
-    for value_size in operation_data["value_size"].unique():
-        data = operation_data[operation_data["value_size"] == value_size]
-        plt.plot(
-            data["data_size"],
-            data["time"],
+    ax.clear()
+
+    series = _plot_arrays(
+        operation_data["data_size"].to_numpy(np.int32),
+        operation_data["value_size"].to_numpy(np.int64),
+        operation_data["time"].to_numpy(np.float64),
+    )
+    for value_size, data_sizes, times in series:
+        ax.plot(
+            data_sizes,
+            times,
             marker="o",
             label=f"Value size: {value_size} bytes",
         )
 
-    plt.xlabel("Data Size (number of key-value pairs)")
-    plt.ylabel("Time per Operation (seconds)")
-    plt.title(f"{operation.replace('_', ' ').title()} Time vs Data Size")
-    plt.legend()
-    plt.grid(True)
-    plt.savefig(os.path.join(output_dir, f"{operation}_time.png"))
-    plt.close()
+    ax.set_xlabel("Data Size (number of key-value pairs)")
+    ax.set_ylabel("Time per Operation (seconds)")
+    ax.set_title(f"{operation.replace('_', ' ').title()} Time vs Data Size")
+    ax.legend()
+    ax.grid(True)
+    ax.figure.savefig(os.path.join(output_dir, f"{operation}_time.png"), dpi=dpi)
 
 
-def plot_operation_comparison(df: pd.DataFrame, output_dir: str):
+def plot_operation_comparison(
+    df: pd.DataFrame, ax: plt.Axes, output_dir: str, dpi: int = 100
+):
     """Plot comparison of different operations.
 
     Args:
     ----
         df: DataFrame containing benchmark data
+        ax: Axes to draw on; cleared before plotting so it can be reused
         output_dir: Directory to save the plot
+        dpi: Resolution of the saved image
 
     """
-    plt.figure(figsize=(12, 6))
-    sns.boxplot(data=df, x="operation", y="time")
-    plt.xlabel("Operation")
-    plt.ylabel("Time per Operation (seconds)")
-    plt.title("Operation Time Comparison")
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, "operation_comparison.png"))
-    plt.close()
-
-
-def plot_value_size_impact(df: pd.DataFrame, output_dir: str):
+    ax.clear()
+    groups = df.groupby("operation", sort=False, observed=True)["time"]
+    labels, times = zip(*((operation, t.to_numpy()) for operation, t in groups))
+    ax.boxplot(times)
+    ax.set_xticks(range(1, len(labels) + 1), labels)
+    ax.set_xlabel("Operation")
+    ax.set_ylabel("Time per Operation (seconds)")
+    ax.set_title("Operation Time Comparison")
+    ax.tick_params(axis="x", labelrotation=45)
+    ax.figure.savefig(
+        os.path.join(output_dir, "operation_comparison.png"),
+        dpi=dpi,
+        bbox_inches="tight",
+    )
+
+
+def plot_value_size_impact(
+    df: pd.DataFrame, ax: plt.Axes, output_dir: str, dpi: int = 100
+):
     """Plot impact of value size on operation time.
 
     Args:
     ----
         df: DataFrame containing benchmark data
+        ax: Axes to draw on; cleared before plotting so it can be reused
+        output_dir: Directory to save the plot
+        dpi: Resolution of the saved image
+
+    """
+    ax.clear()
+    sns.violinplot(data=df, x="value_size", y="time", hue="operation", ax=ax)
+    ax.set_xlabel("Value Size (bytes)")
+    ax.set_ylabel("Time per Operation (seconds)")
+    ax.set_title("Impact of Value Size on Operation Time")
+    ax.legend(bbox_to_anchor=(1.05, 1), loc="upper left")
+    ax.figure.savefig(
+        os.path.join(output_dir, "value_size_impact.png"),
+        dpi=dpi,
+        bbox_inches="tight",
+    )
+
+
+# Figure size in inches of each plot, keyed by plotting function
+PLOT_FIGSIZES = {
+    plot_operation_times: (10, 6),
+    plot_operation_comparison: (12, 6),
+    plot_value_size_impact: (12, 6),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_axes(figsize: Tuple[float, float]) -> plt.Axes:
+    """Return this process's reusable plotting Axes for a figure size."""
+    _, ax = plt.subplots(figsize=figsize)
+    return ax
+
+
+def _render_plot(plot: Callable, args: Tuple, output_dir: str, dpi: int):
+    """Render a single plot onto this process's shared Axes of its size.
+
+    Args:
+    ----
+        plot: Plotting function taking ``(*args, ax, output_dir, dpi)``
+        args: Leading positional arguments for ``plot``
         output_dir: Directory to save the plot
+        dpi: Resolution of the saved image
 
     """
-    plt.figure(figsize=(12, 6))
-    sns.violinplot(data=df, x="value_size", y="time", hue="operation")
-    plt.xlabel("Value Size (bytes)")
-    plt.ylabel("Time per Operation (seconds)")
-    plt.title("Impact of Value Size on Operation Time")
-    plt.legend(bbox_to_anchor=(1.05, 1), loc="upper left")
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, "value_size_impact.png"))
-    plt.close()
-
-
-def generate_plots(results: Dict[str, List[Dict[str, Any]]], output_dir: str):
+    ax = _shared_axes(PLOT_FIGSIZES[plot])
+    plot(*args, ax=ax, output_dir=output_dir, dpi=dpi)
+
+
+def generate_plots(df: pd.DataFrame, output_dir: str, dpi: int = 100):
     """Generate all benchmark plots.
 
     Args:
     ----
-        results: Dictionary containing benchmark results
+        df: DataFrame containing benchmark data
         output_dir: Directory to save the plots
+        dpi: Resolution of the saved images; use 300 for publication output
 
     """
     os.makedirs(output_dir, exist_ok=True)
-    df = create_dataframe(results)
 
-    for operation in results.keys():
-        plot_operation_times(df, operation, output_dir)
+    jobs = [
+        (plot_operation_times, (operation_data, operation))
+        for operation, operation_data in df.groupby(
+            "operation", sort=False, observed=True
+        )
+    ]
+    jobs.append((plot_operation_comparison, (df,)))
+    jobs.append((plot_value_size_impact, (df,)))
 
-    plot_operation_comparison(df, output_dir)
-    plot_value_size_impact(df, output_dir)
+    # Plots are independent: render them in parallel, each worker reusing
+    # one figure for every plot it draws
+    with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+        futures = [
+            pool.submit(_render_plot, plot, args, output_dir, dpi)
+            for plot, args in jobs
+        ]
+        for future in futures:
+            future.result()
 
 
-def generate_benchmark_report(
-    results: Dict[str, List[Dict[str, Any]]], output_dir: str
-):
+def _markdown_table(table: pd.DataFrame) -> str:
+    """Format a DataFrame as a markdown table.
+
+    Args:
+    ----
+        table: DataFrame to format; its index becomes the first column
+
+    Returns:
+    -------
+        The markdown table as a single string
+
+    """
+    index_name = ", ".join(str(name) for name in table.index.names if name)
+    header = [index_name, *map(str, table.columns)]
+    cells = table.to_numpy().astype(str)
+    rows = (
+        "| " + " | ".join((str(label), *values)) + " |"
+        for label, values in zip(table.index, cells)
+    )
+    return "\n".join(
+        (
+            "| " + " | ".join(header) + " |",
+            "|:---|" + "---:|" * len(table.columns),
+            *rows,
+        )
+    )
+
+
+def generate_benchmark_report(df: pd.DataFrame, output_dir: str):
     """Generate a markdown report of benchmark results.
 
     Args:
     ----
-        results: Dictionary containing benchmark results
+        df: DataFrame containing benchmark data
         output_dir: Directory to save the report
 
     """
     os.makedirs(output_dir, exist_ok=True)
-    df = create_dataframe(results)
 
     # Calculate summary statistics
     summary = (
-        df.groupby(["operation", "value_size"])["time"]
+        df.groupby(["operation", "value_size"], observed=True)["time"]
         .agg(["mean", "std", "min", "max"])
         .round(6)
     )
@@ -191,7 +431,7 @@ def generate_benchmark_report(
 
     # Add summary statistics
     report.append("## Performance Summary\n")
-    report.append(summary.to_markdown())
+    report.append(_markdown_table(summary))
     report.append("\n")
 
     # Write report
@@ -200,11 +440,20 @@ def generate_benchmark_report(
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Plot PyBitcask benchmark results")
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        default=100,
+        help="Resolution of the saved plots (use 300 for publication output)",
+    )
+    args = parser.parse_args()
+
     # Load results
-    results = load_results()
+    df = load_dataframe()
 
     # Generate plots
-    generate_plots(results, "benchmarks/plots")
+    generate_plots(df, "benchmarks/plots", dpi=args.dpi)
 
     # Generate and save report
-    generate_benchmark_report(results, "benchmarks/results")
+    generate_benchmark_report(df, "benchmarks/results")
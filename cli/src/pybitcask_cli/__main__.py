@@ -5,37 +5,83 @@ including operations like put, get, delete, and mode switching.
 """
 
 import atexit
-import json
-import subprocess
-import sys
-from os.path import abspath, dirname
+import os
+import shutil
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 import click
-import pkg_resources
 
-from pybitcask.bitcask import Bitcask
 from pybitcask.config import config as bitcask_config
 
-# Add the project root to Python path
-project_root = dirname(dirname(dirname(dirname(abspath(__file__)))))
-sys.path.append(project_root)
+# ANSI style prefixes for the common message colors, built once at import
+# instead of by a click.style call per message
+_GREEN = click.style("", fg="green", reset=False)
+_RED = click.style("", fg="red", reset=False)
+_YELLOW = click.style("", fg="yellow", reset=False)
+_BLUE = click.style("", fg="blue", reset=False)
+_BOLD_GREEN = click.style("", fg="green", bold=True, reset=False)
+_BOLD_YELLOW = click.style("", fg="yellow", bold=True, reset=False)
+_BOLD_BLUE = click.style("", fg="blue", bold=True, reset=False)
+_RESET = click.style("", reset=True)
+
+# Fully styled static messages
+_WARN_BANNER = f"{_BOLD_YELLOW}⚠️ WARNING: Switching modes will delete ALL data!{_RESET}"
+_UNDO_MSG = f"{_YELLOW}This action cannot be undone.{_RESET}"
+_MODE_CANCELLED = f"{_BLUE}Mode switch cancelled{_RESET}"
+_AVAILABLE_KEYS_HDR = f"{_BLUE}Available keys:{_RESET}"
+_NO_KEYS = f"{_YELLOW}No keys found in database{_RESET}"
+
+
+def _echo(message: str, style: str, err: bool = False) -> None:
+    """Echo a message wrapped in a precomputed style prefix.
+
+    Args:
+    ----
+        message: The message to print
+        style: One of the module's style prefixes, e.g. ``_GREEN``
+        err: Whether to print to stderr instead of stdout
 
-# Version compatibility check
-try:
-    cli_version = pkg_resources.get_distribution("pybitcask-cli").version
-    core_version = pkg_resources.get_distribution("pybitcask").version
-    if cli_version != core_version:
-        click.echo(
-            click.style(
-                f"Warning: CLI version ({cli_version}) differs from "
-                f"core version ({core_version})",
-                fg="yellow",
-            )
-        )
-except pkg_resources.DistributionNotFound:
-    pass  # Skip version check if not installed as package
+    """
+    click.echo(f"{style}{message}{_RESET}", err=err)
+
+
+# Number of keys written per chunk by the list command
+_LIST_CHUNK_SIZE = 1000
+
+# Below this many files a thread pool costs more than it saves
+_PARALLEL_UNLINK_MIN = 128
+
+
+def _wipe_data_dir(data_dir: Path) -> None:
+    """Remove everything in a data directory except its config.json.
+
+    Large directories unlink their files from a thread pool. Unlinks in one
+    directory still serialize on the directory lock in the kernel, but the
+    pool overlaps the Python-side work around each syscall.
+
+    Args:
+    ----
+        data_dir: The data directory to empty
+
+    """
+    files = []
+    with os.scandir(data_dir) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path, ignore_errors=True)
+            elif entry.name != "config.json":
+                files.append(entry.path)
+
+    if len(files) > _PARALLEL_UNLINK_MIN:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in executor.map(os.unlink, files):
+                pass
+    else:
+        for path in files:
+            os.unlink(path)
 
 
 class BitcaskCLI:
@@ -46,6 +92,17 @@ class BitcaskCLI:
     switching.
     """
 
+    __slots__ = (
+        "_data_dir_arg",
+        "_data_dir",
+        "_debug_mode",
+        "db",
+        "server",
+        "server_thread",
+        "server_url",
+        "_close_registered",
+    )
+
     def __init__(
         self,
         data_dir: Optional[str] = None,
@@ -59,29 +116,52 @@ class BitcaskCLI:
             debug_mode: Whether to run in debug mode (human-readable format)
 
         """
-        self.data_dir = bitcask_config.get_data_dir(data_dir)
-        self.debug_mode = (
-            debug_mode if debug_mode is not None else bitcask_config.get_debug_mode()
-        )
+        # Resolved against the config on first use, see the properties below
+        self._data_dir_arg = data_dir
+        self._data_dir = None
+        self._debug_mode = debug_mode
         self.db = None
-        self.server_process = None
+        self.server = None
+        self.server_thread = None
         self.server_url = None
+        self._close_registered = False
+
+    @property
+    def data_dir(self) -> Path:
+        """Get the data directory, resolving it from the config on first use."""
+        if self._data_dir is None:
+            self._data_dir = bitcask_config.get_data_dir(self._data_dir_arg)
+        return self._data_dir
+
+    @property
+    def debug_mode(self) -> bool:
+        """Get the debug mode, reading it from the config on first use."""
+        if self._debug_mode is None:
+            self._debug_mode = bitcask_config.get_debug_mode()
+        return self._debug_mode
+
+    @debug_mode.setter
+    def debug_mode(self, debug_mode: bool) -> None:
+        self._debug_mode = debug_mode
 
     def ensure_db(self) -> None:
         """Ensure the database connection is established."""
-        if self.db is None:
-            # Always use the current configuration for debug mode
-            current_debug_mode = bitcask_config.get_debug_mode()
-            self.db = Bitcask(
-                str(self.data_dir),
-                debug_mode=current_debug_mode,
-            )
-            atexit.register(self.close)
+        if self.db is not None:
+            return
+
+        # Imported here so commands that never open the database skip it
+        from pybitcask.bitcask import Bitcask
 
-    def refresh_db(self) -> None:
-        """Close and reopen the database connection."""
-        self.close()
-        self.ensure_db()
+        # Always use the current configuration for debug mode
+        current_debug_mode = bitcask_config.get_debug_mode()
+        self.db = Bitcask(
+            str(self.data_dir),
+            debug_mode=current_debug_mode,
+        )
+        # Register once; close() followed by a reopen must not add another
+        if not self._close_registered:
+            atexit.register(self.close)
+            self._close_registered = True
 
     def get_current_mode(self) -> str:
         """Get the current mode as a string."""
@@ -92,7 +172,7 @@ class BitcaskCLI:
     def show_mode(self) -> None:
         """Show the current mode."""
         mode = self.get_current_mode()
-        click.echo(click.style(f"Current mode: {mode}", fg="blue"))
+        _echo(f"Current mode: {mode}", _BLUE)
 
     def put(self, key: str, value: str) -> None:
         """Store a value in the database."""
@@ -100,10 +180,9 @@ class BitcaskCLI:
             self.ensure_db()
             self.db.put(key, value)
             msg = f"✓ Successfully stored value for key: {key}"
-            click.echo(click.style(msg, fg="green"))
-            self.refresh_db()  # Refresh after write
+            _echo(msg, _GREEN)
         except Exception as e:
-            click.echo(click.style(f"✗ Error: {e}", fg="red"), err=True)
+            _echo(f"✗ Error: {e}", _RED, err=True)
 
     def get(self, key: str) -> None:
         """Retrieve a value from the database."""
@@ -112,12 +191,12 @@ class BitcaskCLI:
             value = self.db.get(key)
             if value is None:
                 msg = f"✗ Key '{key}' not found"
-                click.echo(click.style(msg, fg="yellow"))
+                _echo(msg, _YELLOW)
                 return
-            click.echo(click.style(f"Value for key '{key}':", fg="blue"))
+            _echo(f"Value for key '{key}':", _BLUE)
             click.echo(value)
         except Exception as e:
-            click.echo(click.style(f"✗ Error: {e}", fg="red"), err=True)
+            _echo(f"✗ Error: {e}", _RED, err=True)
 
     def delete(self, key: str) -> None:
         """Delete a value from the database."""
@@ -125,24 +204,64 @@ class BitcaskCLI:
             self.ensure_db()
             self.db.delete(key)
             msg = f"✓ Successfully deleted key: {key}"
-            click.echo(click.style(msg, fg="green"))
-            self.refresh_db()  # Refresh after write
+            _echo(msg, _GREEN)
         except Exception as e:
-            click.echo(click.style(f"✗ Error: {e}", fg="red"), err=True)
+            _echo(f"✗ Error: {e}", _RED, err=True)
+
+    def batch(self, lines: Iterable[str], chunk_size: int = 1000) -> None:
+        """Store NDJSON key/value records in batches.
+
+        Args:
+        ----
+            lines: Lines of ``{"key": ..., "value": ...}`` JSON objects
+            chunk_size: Number of records written per batch_write call
+
+        """
+        import json
+
+        try:
+            if chunk_size < 1:
+                raise ValueError("chunk size must be at least 1")
+            self.ensure_db()
+            buf = {}
+            count = 0
+            for line in lines:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                buf[record["key"]] = record["value"]
+                if len(buf) >= chunk_size:
+                    self.db.batch_write(buf)
+                    count += len(buf)
+                    buf.clear()
+            if buf:
+                self.db.batch_write(buf)
+                count += len(buf)
+            _echo(f"✓ Successfully stored {count} records", _GREEN)
+        except Exception as e:
+            _echo(f"✗ Error: {e}", _RED, err=True)
 
     def list_keys(self) -> None:
         """List all keys in the database."""
         try:
             self.ensure_db()
-            keys = self.db.list_keys()
-            if not keys:
-                click.echo(click.style("No keys found in database", fg="yellow"))
+            keys = self.db.iter_keys()
+            first = next(keys, None)
+            if first is None:
+                click.echo(_NO_KEYS)
                 return
-            click.echo(click.style("Available keys:", fg="blue"))
+            click.echo(_AVAILABLE_KEYS_HDR)
+            # Stream the keys in chunks rather than one write per key or one
+            # string holding the whole listing
+            chunk = [f"  • {first}\n"]
             for key in keys:
-                click.echo(f"  • {key}")
+                chunk.append(f"  • {key}\n")
+                if len(chunk) >= _LIST_CHUNK_SIZE:
+                    click.echo("".join(chunk), nl=False)
+                    chunk.clear()
+            click.echo("".join(chunk), nl=False)
         except Exception as e:
-            click.echo(click.style(f"✗ Error: {e}", fg="red"), err=True)
+            _echo(f"✗ Error: {e}", _RED, err=True)
 
     def clear(self) -> None:
         """Clear all data from the database."""
@@ -150,9 +269,9 @@ class BitcaskCLI:
             self.ensure_db()
             self.db.clear()
             msg = "✓ Successfully cleared all data"
-            click.echo(click.style(msg, fg="green"))
+            _echo(msg, _GREEN)
         except Exception as e:
-            click.echo(click.style(f"✗ Error: {e}", fg="red"), err=True)
+            _echo(f"✗ Error: {e}", _RED, err=True)
 
     def compact_stats(self) -> None:
         """Show compaction statistics."""
@@ -160,7 +279,7 @@ class BitcaskCLI:
             self.ensure_db()
             stats = self.db.get_compaction_stats()
 
-            click.echo(click.style("📊 Database Statistics:", fg="blue", bold=True))
+            _echo("📊 Database Statistics:", _BOLD_BLUE)
             click.echo(f"  Files: {stats['total_files']}")
             click.echo(
                 f"  Total size: {stats['total_size']:,} bytes "
@@ -175,18 +294,12 @@ class BitcaskCLI:
 
             # Show recommendation
             if self.db.should_compact():
-                click.echo(
-                    click.style(
-                        "💡 Recommendation: Compaction is recommended", fg="yellow"
-                    )
-                )
+                _echo("💡 Recommendation: Compaction is recommended", _YELLOW)
             else:
-                click.echo(
-                    click.style("✓ Recommendation: Compaction not needed", fg="green")
-                )
+                _echo("✓ Recommendation: Compaction not needed", _GREEN)
 
         except Exception as e:
-            click.echo(click.style(f"✗ Error: {e}", fg="red"), err=True)
+            _echo(f"✗ Error: {e}", _RED, err=True)
 
     def compact(self, threshold: float = 0.3, force: bool = False) -> None:
         """Compact the database to reclaim space."""
@@ -196,7 +309,7 @@ class BitcaskCLI:
             if not force:
                 # Show stats first
                 stats = self.db.get_compaction_stats()
-                click.echo(click.style("📊 Pre-compaction Statistics:", fg="blue"))
+                _echo("📊 Pre-compaction Statistics:", _BLUE)
                 click.echo(
                     f"  Total size: {stats['total_size']:,} bytes "
                     f"({stats['total_size'] / (1024 * 1024):.2f} MB)"
@@ -204,31 +317,21 @@ class BitcaskCLI:
                 click.echo(f"  Dead data ratio: {stats['estimated_dead_ratio']:.1%}")
 
                 if not self.db.should_compact(threshold):
-                    click.echo(
-                        click.style(
-                            "ℹ️ Compaction not needed (threshold not met)", fg="blue"
-                        )
-                    )
+                    _echo("ℹ️ Compaction not needed (threshold not met)", _BLUE)
                     if not click.confirm("Do you want to force compaction anyway?"):
                         return
                     force = True
 
             # Perform compaction
-            click.echo(click.style("🔄 Starting compaction...", fg="yellow"))
+            _echo("🔄 Starting compaction...", _YELLOW)
             result = self.db.compact(threshold_ratio=threshold, force=force)
 
             if not result["performed"]:
-                click.echo(
-                    click.style(f"ℹ️ Compaction skipped: {result['reason']}", fg="blue")
-                )
+                _echo(f"ℹ️ Compaction skipped: {result['reason']}", _BLUE)
                 return
 
             # Show results
-            click.echo(
-                click.style(
-                    "✓ Compaction completed successfully!", fg="green", bold=True
-                )
-            )
+            _echo("✓ Compaction completed successfully!", _BOLD_GREEN)
             click.echo(f"  Duration: {result['duration_seconds']:.2f} seconds")
             click.echo(f"  Records written: {result['records_written']:,}")
             click.echo(f"  Files removed: {result['files_removed']}")
@@ -238,11 +341,8 @@ class BitcaskCLI:
             )
             click.echo(f"  Space reduction: {result['space_saved_ratio']:.1%}")
 
-            # Refresh database connection
-            self.refresh_db()
-
         except Exception as e:
-            click.echo(click.style(f"✗ Compaction failed: {e}", fg="red"), err=True)
+            _echo(f"✗ Compaction failed: {e}", _RED, err=True)
 
     def close(self) -> None:
         """Close the database connection."""
@@ -255,12 +355,11 @@ class BitcaskCLI:
         try:
             # Show warning and get confirmation
             mode = "debug" if debug_mode else "normal"
-            msg = "⚠️ WARNING: Switching modes will delete ALL data!"
-            click.echo(click.style(msg, fg="yellow", bold=True))
-            click.echo(click.style("This action cannot be undone.", fg="yellow"))
+            click.echo(_WARN_BANNER)
+            click.echo(_UNDO_MSG)
             confirm_msg = f"Do you want to switch to {mode} mode?"
             if not click.confirm(click.style(confirm_msg, fg="yellow")):
-                click.echo(click.style("Mode switch cancelled", fg="blue"))
+                click.echo(_MODE_CANCELLED)
                 return
 
             # Close and clear the database
@@ -268,30 +367,26 @@ class BitcaskCLI:
                 self.db.close()
                 self.db = None
 
-            # Delete all data files and clear the directory
+            # Delete everything in the data directory except config.json
             if self.data_dir.exists():
-                for file in self.data_dir.glob("*"):
-                    if file.is_file():
-                        file.unlink()
-                # Recreate the directory if it was deleted
-                self.data_dir.mkdir(exist_ok=True)
+                _wipe_data_dir(self.data_dir)
 
             # Switch mode and create new database
             bitcask_config.set_debug_mode(debug_mode)  # Update global config first
             self.debug_mode = debug_mode  # Update CLI object's mode
-            self.db = Bitcask(str(self.data_dir), debug_mode=debug_mode)
+            self.ensure_db()
 
-            click.echo(click.style(f"✓ Switched to {mode} mode", fg="green"))
-            click.echo(click.style("✓ Database cleared completely", fg="green"))
+            _echo(f"✓ Switched to {mode} mode", _GREEN)
+            _echo("✓ Database cleared completely", _GREEN)
         except Exception as e:
-            click.echo(click.style(f"✗ Error: {e}", fg="red"), err=True)
+            _echo(f"✗ Error: {e}", _RED, err=True)
 
     def start_server(self, port: int = 8000) -> None:
-        """Start the Bitcask server as a subprocess on the specified port.
+        """Run the Bitcask server in-process on the specified port.
 
-        Initialize the server using the current configuration, set up signal
-        handlers for graceful shutdown, and display server status and URL
-        information in the CLI.
+        Serve the FastAPI app with uvicorn on a background thread, so no second
+        interpreter has to start and re-import the server stack. The call
+        blocks until the server stops; SIGINT/SIGTERM shut it down gracefully.
 
         Args:
         ----
@@ -300,75 +395,73 @@ class BitcaskCLI:
         """
         try:
             msg = f"Starting Bitcask server on port {port}..."
-            click.echo(click.style(msg, fg="blue"))
+            _echo(msg, _BLUE)
 
-            # Get the server script path
-            cwd = dirname(dirname(abspath(__file__)))
-            server_script = Path(cwd) / "server.py"
+            import signal
+            import threading
 
-            if not server_script.exists():
-                click.echo(
-                    click.style("✗ Error: Server script not found", fg="red"), err=True
-                )
-                return
+            import uvicorn
+
+            from .server import app, initialize_database
 
-            # Start the server process with the current configuration
-            cmd = [
-                "python",
-                str(server_script),
-                "--port",
-                str(port),
-                "--data-dir",
-                str(self.data_dir),
-                "--debug" if self.debug_mode else "",
-            ]
+            # Serve the CLI's own handle rather than opening the data files twice
+            self.ensure_db()
+            initialize_database(str(self.data_dir), self.debug_mode, database=self.db)
+            self.server = uvicorn.Server(
+                uvicorn.Config(app, host="127.0.0.1", port=port, log_level="info")
+            )
+            self.server_thread = threading.Thread(target=self.server.run, daemon=True)
 
             # Register signal handlers for graceful shutdown
             def signal_handler(signum, frame):
                 """Handle termination signals to gracefully shut down the server.
 
-                Output a shutdown message, stop the running server, and exit the
-                program when a termination signal is received.
+                Output a shutdown message and ask the running server to stop.
                 """
-                click.echo(click.style("\nShutting down server...", fg="yellow"))
+                _echo("\nShutting down server...", _YELLOW)
                 self.stop_server()
-                sys.exit(0)
-
-            import signal
 
-            signal.signal(signal.SIGINT, signal_handler)
-            signal.signal(signal.SIGTERM, signal_handler)
+            previous_handlers = {
+                signum: signal.signal(signum, signal_handler)
+                for signum in (signal.SIGINT, signal.SIGTERM)
+            }
+            try:
+                self.server_thread.start()
+                self.server_url = f"http://localhost:{port}"
 
-            self.server_process = subprocess.Popen(cmd, cwd=cwd)
-            atexit.register(self.stop_server)
-            self.server_url = f"http://localhost:{port}"
+                _echo("✓ Server started successfully", _GREEN)
+                _echo(f"Server URL: {self.server_url}", _BLUE)
+                _echo("Press Ctrl+C to stop the server", _YELLOW)
 
-            click.echo(click.style("✓ Server started successfully", fg="green"))
-            click.echo(click.style(f"Server URL: {self.server_url}", fg="blue"))
-            click.echo(click.style("Press Ctrl+C to stop the server", fg="yellow"))
+                self.server_thread.join()
+            finally:
+                # Give Ctrl+C back to the caller, e.g. the interactive shell
+                for signum, handler in previous_handlers.items():
+                    signal.signal(signum, handler)
         except Exception as e:
             msg = f"✗ Error starting server: {e}"
-            click.echo(click.style(msg, fg="red"), err=True)
+            _echo(msg, _RED, err=True)
 
     def stop_server(self) -> None:
         """Stop the Bitcask server."""
-        if self.server_process:
-            try:
-                self.server_process.terminate()
-                self.server_process.wait(
-                    timeout=5
-                )  # Wait up to 5 seconds for graceful shutdown
-                click.echo(click.style("✓ Server stopped successfully", fg="green"))
-            except subprocess.TimeoutExpired:
-                self.server_process.kill()  # Force kill if graceful shutdown fails
-                click.echo(click.style("! Server forcefully stopped", fg="yellow"))
-            except Exception as e:
-                click.echo(
-                    click.style(f"✗ Error stopping server: {e}", fg="red"), err=True
-                )
-            finally:
-                self.server_process = None
-                self.server_url = None
+        server, server_thread = self.server, self.server_thread
+        if server is None:
+            return
+        self.server = None
+        self.server_thread = None
+        self.server_url = None
+
+        try:
+            server.should_exit = True
+            # Wait up to 5 seconds for graceful shutdown
+            server_thread.join(timeout=5)
+            if server_thread.is_alive():
+                server.force_exit = True  # Skip waiting on open connections
+                _echo("! Server forcefully stopped", _YELLOW)
+            else:
+                _echo("✓ Server stopped successfully", _GREEN)
+        except Exception as e:
+            _echo(f"✗ Error stopping server: {e}", _RED, err=True)
 
 
 @click.group()
@@ -377,10 +470,13 @@ class BitcaskCLI:
 @click.pass_context
 def cli(ctx, data_dir, debug):
     """Bitcask CLI - A command-line interface for the Bitcask key-value store."""
-    ctx.obj = BitcaskCLI(
-        data_dir,
-        debug_mode=debug,
-    )
+    if ctx.resilient_parsing:
+        return  # Shell completion only needs the command tree
+    if ctx.obj is None:  # Commands run from `pbc shell` reuse its instance
+        ctx.obj = BitcaskCLI(
+            data_dir,
+            debug_mode=debug,
+        )
 
 
 @cli.command()
@@ -408,6 +504,21 @@ def delete(cli: BitcaskCLI, key: str):
     cli.delete(key)
 
 
+@cli.command()
+@click.option(
+    "--input",
+    "input_file",
+    type=click.File("r"),
+    default="-",
+    help="NDJSON file of key/value records, or - for stdin",
+)
+@click.option("--chunk-size", default=1000, help="Records written per batch")
+@click.pass_obj
+def batch(cli: BitcaskCLI, input_file, chunk_size: int):
+    """Store many values from NDJSON lines of {"key": ..., "value": ...}."""
+    cli.batch(input_file, chunk_size=chunk_size)
+
+
 @cli.command()
 @click.pass_obj
 def list(cli: BitcaskCLI):
@@ -422,6 +533,60 @@ def clear(cli: BitcaskCLI):
     cli.clear()
 
 
+@cli.command()
+@click.pass_context
+def shell(ctx):
+    """Run commands interactively against a single open database."""
+    import shlex
+
+    root = ctx.find_root().command
+    _echo("PyBitcask shell - type 'help' for commands, 'exit' to quit", _BLUE)
+    while True:
+        try:
+            line = input("pbc> ")
+        except (EOFError, KeyboardInterrupt):
+            click.echo()
+            break
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            _echo(f"✗ Error: {e}", _RED, err=True)
+            continue
+        if not args:
+            continue
+        if args[0] in ("exit", "quit"):
+            break
+        if args[0] == "help":
+            args = ["--help"]
+        elif args[0] == "shell":
+            continue
+
+        try:
+            root.main(args, prog_name="pbc", standalone_mode=False, obj=ctx.obj)
+        except click.ClickException as e:
+            e.show()
+        except click.Abort:
+            click.echo()
+
+
+@cli.command()
+def version():
+    """Show the CLI and core library versions."""
+    from importlib.metadata import PackageNotFoundError
+    from importlib.metadata import version as dist_version
+
+    try:
+        cli_version = dist_version("pybitcask-cli")
+        core_version = dist_version("pybitcask")
+    except PackageNotFoundError as e:
+        _echo(f"✗ Package not installed: {e}", _RED, err=True)
+        return
+    click.echo(f"pybitcask-cli {cli_version}")
+    click.echo(f"pybitcask {core_version}")
+    if cli_version != core_version:
+        _echo("Warning: CLI version differs from core version", _YELLOW)
+
+
 @cli.group()
 def compact():
     """Database compaction commands."""
@@ -482,16 +647,12 @@ def config():
 def view(cli: BitcaskCLI):
     """View current configuration."""
     try:
-        if not cli.data_dir.exists():
-            click.echo(click.style("No configuration file found", fg="yellow"))
-            return
-
-        with open(cli.data_dir / "config.json") as f:
-            current_config = json.load(f)
-            click.echo(click.style("Current configuration:", fg="blue"))
-            click.echo(f"  • Debug mode: {current_config.get('debug_mode', False)}")
+        # Parsed once at startup; no need to read the file again
+        current_config = bitcask_config.config_data
+        _echo("Current configuration:", _BLUE)
+        click.echo(f"  • Debug mode: {current_config.get('debug_mode', False)}")
     except Exception as e:
-        click.echo(click.style(f"✗ Error: {e}", fg="red"), err=True)
+        _echo(f"✗ Error: {e}", _RED, err=True)
 
 
 @config.command()
@@ -501,9 +662,9 @@ def reset(cli: BitcaskCLI):
     try:
         bitcask_config.set_debug_mode(False)
         msg = "✓ Configuration reset to defaults"
-        click.echo(click.style(msg, fg="green"))
+        _echo(msg, _GREEN)
     except Exception as e:
-        click.echo(click.style(f"✗ Error: {e}", fg="red"), err=True)
+        _echo(f"✗ Error: {e}", _RED, err=True)
 
 
 @cli.group()
@@ -1,14 +1,16 @@
 """FastAPI server for PyBitcask key-value store."""
 
 import argparse
+import base64
 import logging
 import signal
 import sys
 from typing import Any, Dict, List, Optional
 
-import uvicorn
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+from typing_extensions import Annotated
 
 from pybitcask.bitcask import Bitcask
 from pybitcask.config import config as bitcask_config
@@ -19,6 +21,8 @@ logger = logging.getLogger(__name__)
 
 # Global database instance
 db: Optional[Bitcask] = None
+# Whether db was opened here, rather than passed in by the caller
+_owns_db = False
 
 
 # Pydantic models for request/response
@@ -35,6 +39,21 @@ class BatchPutRequest(BaseModel):
     data: Dict[str, Any]
 
 
+class BulkGetRequest(BaseModel):
+    """Request model for bulk GET operations."""
+
+    keys: List[str]
+
+
+class BulkGetResponse(BaseModel):
+    """Response model for bulk GET operations."""
+
+    values: Dict[str, Any]
+    found: int
+    # Keys whose values are raw bytes, returned base64-encoded
+    raw_keys: List[str] = []
+
+
 class GetResponse(BaseModel):
     """Response model for GET operations."""
 
@@ -71,14 +90,29 @@ app = FastAPI(
     title="PyBitcask Server",
     description="REST API for PyBitcask key-value store",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 
-def initialize_database(data_dir: str, debug_mode: bool = False):
-    """Initialize the database connection."""
-    global db
+def initialize_database(
+    data_dir: str, debug_mode: bool = False, database: Optional[Bitcask] = None
+):
+    """Initialize the database connection.
+
+    Args:
+    ----
+        data_dir: Directory where the database files are stored
+        debug_mode: Whether to use the human-readable format
+        database: An already open database to serve instead of opening one
+
+    """
+    global db, _owns_db
     try:
-        db = Bitcask(data_dir, debug_mode=debug_mode)
+        owned = database is None
+        if owned:
+            database = Bitcask(data_dir, debug_mode=debug_mode)
+        db = database
+        _owns_db = owned
         logger.info(
             f"Database initialized: data_dir={data_dir}, debug_mode={debug_mode}"
         )
@@ -88,12 +122,17 @@ def initialize_database(data_dir: str, debug_mode: bool = False):
 
 
 def cleanup_database():
-    """Clean up database connection."""
-    global db
+    """Clean up database connection.
+
+    A database passed in to initialize_database() is left open for its owner.
+    """
+    global db, _owns_db
     if db:
-        db.close()
+        if _owns_db:
+            db.close()
+            logger.info("Database connection closed")
         db = None
-        logger.info("Database connection closed")
+        _owns_db = False
 
 
 @app.on_event("startup")
@@ -109,28 +148,42 @@ async def shutdown_event():
     cleanup_database()
 
 
-@app.get("/", response_model=StatusResponse)
-async def root():
-    """Get server status."""
-    if not db:
+def get_db() -> Bitcask:
+    """Resolve the database handle for a request.
+
+    Returns
+    -------
+        The initialized database
+
+    """
+    if db is None:
         raise HTTPException(status_code=500, detail="Database not initialized")
+    return db
+
 
+# Handler parameter type that injects the open database
+Database = Annotated[Bitcask, Depends(get_db)]
+
+
+# Handlers that touch the database are plain functions: FastAPI runs them in its
+# threadpool, so blocking disk I/O never stalls the event loop. Bitcask
+# serializes access internally with its own lock.
+@app.get("/", response_model=StatusResponse)
+def root(database: Database):
+    """Get server status."""
     return StatusResponse(
         status="running",
-        mode="debug" if db.debug_mode else "normal",
-        data_dir=str(db.data_dir),
-        keys_count=len(db.list_keys()),
+        mode="debug" if database.debug_mode else "normal",
+        data_dir=str(database.data_dir),
+        keys_count=len(database.list_keys()),
     )
 
 
 @app.post("/put")
-async def put_value(request: PutRequest):
+def put_value(request: PutRequest, database: Database):
     """Store a key-value pair."""
-    if not db:
-        raise HTTPException(status_code=500, detail="Database not initialized")
-
     try:
-        db.put(request.key, request.value)
+        database.put(request.key, request.value)
         return {"status": "success", "key": request.key}
     except Exception as e:
         logger.error(f"Error storing key {request.key}: {e}")
@@ -138,13 +191,10 @@ async def put_value(request: PutRequest):
 
 
 @app.post("/batch")
-async def batch_put(request: BatchPutRequest):
+def batch_put(request: BatchPutRequest, database: Database):
     """Store multiple key-value pairs."""
-    if not db:
-        raise HTTPException(status_code=500, detail="Database not initialized")
-
     try:
-        db.batch_write(request.data)
+        database.batch_write(request.data)
         return {"status": "success", "count": len(request.data)}
     except Exception as e:
         logger.error(f"Error in batch write: {e}")
@@ -152,27 +202,46 @@ async def batch_put(request: BatchPutRequest):
 
 
 @app.get("/get/{key}", response_model=GetResponse)
-async def get_value(key: str):
+def get_value(key: str, database: Database):
     """Retrieve a value by key."""
-    if not db:
-        raise HTTPException(status_code=500, detail="Database not initialized")
-
     try:
-        value = db.get(key)
+        value = database.get(key)
+        if isinstance(value, bytes):
+            # Raw bytes values are returned as-is rather than JSON-encoded
+            return Response(content=value, media_type="application/octet-stream")
         return GetResponse(key=key, value=value, found=value is not None)
     except Exception as e:
         logger.error(f"Error retrieving key {key}: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@app.post("/get_bulk", response_model=BulkGetResponse)
+def get_bulk(request: BulkGetRequest, database: Database):
+    """Retrieve the values of several keys in one request."""
+    try:
+        values: Dict[str, Any] = {}
+        raw_keys = []
+        for key in request.keys:
+            if key in values:
+                continue
+            value = database.get(key)
+            if isinstance(value, bytes):
+                # JSON has no bytes type, so raw values are sent base64-encoded
+                value = base64.b64encode(value).decode("ascii")
+                raw_keys.append(key)
+            values[key] = value
+        found = sum(value is not None for value in values.values())
+        return BulkGetResponse(values=values, found=found, raw_keys=raw_keys)
+    except Exception as e:
+        logger.error(f"Error in bulk get: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
 @app.delete("/delete/{key}", response_model=DeleteResponse)
-async def delete_value(key: str):
+def delete_value(key: str, database: Database):
     """Delete a key-value pair."""
-    if not db:
-        raise HTTPException(status_code=500, detail="Database not initialized")
-
     try:
-        deleted = db.delete(key)
+        deleted = database.delete(key)
         return DeleteResponse(key=key, deleted=deleted)
     except Exception as e:
         logger.error(f"Error deleting key {key}: {e}")
@@ -180,13 +249,10 @@ async def delete_value(key: str):
 
 
 @app.get("/keys", response_model=ListResponse)
-async def list_keys():
+def list_keys(database: Database):
     """List all keys in the database."""
-    if not db:
-        raise HTTPException(status_code=500, detail="Database not initialized")
-
     try:
-        keys = db.list_keys()
+        keys = database.list_keys()
         return ListResponse(keys=keys, count=len(keys))
     except Exception as e:
         logger.error(f"Error listing keys: {e}")
@@ -194,13 +260,10 @@ async def list_keys():
 
 
 @app.post("/clear")
-async def clear_database():
+def clear_database(database: Database):
     """Clear all data from the database."""
-    if not db:
-        raise HTTPException(status_code=500, detail="Database not initialized")
-
     try:
-        db.clear()
+        database.clear()
         return {"status": "success", "message": "Database cleared"}
     except Exception as e:
         logger.error(f"Error clearing database: {e}")
@@ -222,6 +285,9 @@ def signal_handler(signum, frame):
 
 def main():
     """Start the PyBitcask server."""
+    # Only the standalone entry point runs uvicorn itself
+    import uvicorn
+
     parser = argparse.ArgumentParser(description="PyBitcask Server")
     parser.add_argument("--host", default="127.0.0.1", help="Host to bind to")
     parser.add_argument("--port", type=int, default=8000, help="Port to bind to")
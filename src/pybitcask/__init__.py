@@ -1,9 +1,13 @@
 """A Python implementation of Bitcask, a log-structured key/value store."""
 
 # -*- coding: utf-8 -*-
-from .bitcask import Bitcask
-from .rotation import EntryCountRotation, RotationStrategy, SizeBasedRotation
-from .scheduler import CompactionScheduler
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .bitcask import Bitcask
+    from .rotation import EntryCountRotation, RotationStrategy, SizeBasedRotation
+    from .scheduler import CompactionScheduler
 
 __all__ = [
     "Bitcask",
@@ -12,3 +16,22 @@ __all__ = [
     "EntryCountRotation",
     "CompactionScheduler",
 ]
+
+# Submodules are imported on first attribute access, so importing a light
+# submodule such as ``pybitcask.config`` does not load the storage engine
+_LAZY_ATTRS = {
+    "Bitcask": ".bitcask",
+    "RotationStrategy": ".rotation",
+    "SizeBasedRotation": ".rotation",
+    "EntryCountRotation": ".rotation",
+    "CompactionScheduler": ".scheduler",
+}
+
+
+def __getattr__(name: str):
+    """Import public classes from their submodules on first access."""
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    globals()[name] = value
+    return value
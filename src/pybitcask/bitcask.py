@@ -2,14 +2,29 @@
 
 # -*- coding: utf-8 -*-
 import logging
+import mmap
 import os
 import threading
 import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import IO, TYPE_CHECKING, Any, Callable, Dict, Optional
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 if TYPE_CHECKING:
+    from .rotation import RotationStrategy
     from .scheduler import CompactionScheduler
 
 from .config import config
@@ -19,13 +34,46 @@ from .formats import (
     ProtoFormat,
     get_format_by_identifier,
 )
-from .rotation import RotationStrategy
 
 # Set up logging
 logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
 
+class IndexEntry(NamedTuple):
+    """Location of the latest record for a key."""
+
+    file_id: int
+    value_size: int
+    value_pos: int
+    timestamp: int
+
+
+# Cached read state of a data file: (fd, format, mmap or None)
+_ReadHandle = Tuple[int, DataFormat, Optional[mmap.mmap]]
+
+
+def _pread(fd: int, size: int, offset: int) -> bytes:
+    """Read ``size`` bytes at ``offset`` without moving a shared file position.
+
+    Args:
+    ----
+        fd: File descriptor to read from
+        size: Number of bytes to read
+        offset: Absolute position to read at
+
+    Returns:
+    -------
+        The bytes read, shorter than ``size`` only at end of file
+
+    """
+    if hasattr(os, "pread"):
+        return os.pread(fd, size, offset)
+    # Windows has no pread; callers hold the database lock, so seek+read is safe
+    os.lseek(fd, offset, os.SEEK_SET)
+    return os.read(fd, size)
+
+
 class Bitcask:
     """A log-structured hash table for fast key/value data storage.
 
@@ -37,11 +85,23 @@ class Bitcask:
     # Size of format identifier in bytes
     FORMAT_ID_SIZE = 1
 
+    # Durability modes: "always" fsyncs deletes as they are written, "manual"
+    # defers fsync to explicit sync() calls and close(), and "batch" group
+    # commits: writes are buffered and flushed with one fsync per batch
+    SYNC_MODES = ("always", "manual", "batch")
+
+    # Maximum number of data files kept open for reads
+    MAX_READ_FDS = 64
+
     def __init__(
         self,
         directory: Optional[str] = None,
         debug_mode: Optional[bool] = None,
-        rotation_strategy: Optional[RotationStrategy] = None,
+        rotation_strategy: Optional["RotationStrategy"] = None,
+        sync: str = "always",
+        group_commit_bytes: int = 1024 * 1024,
+        group_commit_interval: float = 0.01,
+        value_cache_size: int = 0,
     ):
         """Initialize a new Bitcask instance.
 
@@ -53,8 +113,31 @@ class Bitcask:
                        If None, uses the configured debug mode.
             rotation_strategy: Strategy for rotating data files.
                               If None, files are not automatically rotated.
+            sync: Durability mode. "always" fsyncs every delete as it is
+                  written; "manual" only fsyncs on sync() and close();
+                  "batch" flushes and fsyncs pending writes together once
+                  group_commit_bytes accumulate or group_commit_interval
+                  elapses, whichever comes first.
+            group_commit_bytes: Pending bytes that trigger a group commit in
+                               "batch" mode.
+            group_commit_interval: Seconds between background group commits in
+                                  "batch" mode.
+            value_cache_size: Number of decoded values kept in an LRU cache
+                             for get(); 0 disables it. Cached values are
+                             shared between callers and must not be mutated.
 
         """
+        if sync not in self.SYNC_MODES:
+            raise ValueError(f"sync must be one of {self.SYNC_MODES}, got {sync!r}")
+        if group_commit_bytes <= 0:
+            raise ValueError("group_commit_bytes must be positive")
+        if group_commit_interval <= 0:
+            raise ValueError("group_commit_interval must be positive")
+        if value_cache_size < 0:
+            raise ValueError("value_cache_size must not be negative")
+        self.sync_mode = sync
+        self.group_commit_bytes = group_commit_bytes
+        self.group_commit_interval = group_commit_interval
         self.data_dir = config.get_data_dir(directory)
         self.debug_mode = (
             debug_mode if debug_mode is not None else config.get_debug_mode()
@@ -64,7 +147,7 @@ class Bitcask:
         logger.debug("Initialized with format: %s", self.format.__class__.__name__)
 
         # In-memory index: key -> (file_id, value_size, value_pos, timestamp)
-        self.index: Dict[str, dict] = {}
+        self.index: Dict[str, IndexEntry] = {}
 
         # Current active file for writing
         self.active_file: Optional[IO[bytes]] = None
@@ -72,10 +155,28 @@ class Bitcask:
         self.active_file_path: Optional[Path] = None
         self.active_file_entry_count: int = 0
         self.active_file_last_write: Optional[datetime] = None
+        # Offset in the active file where the next record is appended, tracked
+        # here so writes never need a tell()
+        self._write_pos: int = 0
+
+        # Read-only descriptors, formats and (for sealed files) memory maps of
+        # data files, least recently used first: file_id -> (fd, format, mmap)
+        self._read_fds: OrderedDict[int, _ReadHandle] = OrderedDict()
+
+        # Decoded values, least recently used first: (file_id, value_pos) ->
+        # value. Records are never rewritten in place, so entries only go
+        # stale when their file is removed by clear() or compact()
+        self.value_cache_size = value_cache_size
+        self._value_cache: OrderedDict[Tuple[int, int], Any] = OrderedDict()
 
         # Lock for thread safety
         self._lock = threading.RLock()
 
+        # Bytes written since the last group commit ("batch" sync mode)
+        self._pending_bytes = 0
+        self._commit_stop = threading.Event()
+        self._commit_thread: Optional[threading.Thread] = None
+
         # Compaction scheduler (initialized when start_auto_compaction is called)
         self._compaction_scheduler: Optional["CompactionScheduler"] = None
 
@@ -92,13 +193,44 @@ class Bitcask:
         # Initialize or recover from existing data
         self._initialize()
 
+        if self.sync_mode == "batch":
+            self._commit_thread = threading.Thread(
+                target=self._group_commit_loop,
+                name="bitcask-group-commit",
+                daemon=True,
+            )
+            self._commit_thread.start()
+
+    def _data_files(self) -> List[Tuple[int, Path]]:
+        """List the data files in the data directory.
+
+        Uses ``os.scandir`` so file types come from the cached directory
+        entries instead of a ``stat`` per file.
+
+        Returns
+        -------
+            List of (file_id, path) tuples, ordered by file id
+
+        """
+        data_files = []
+        with os.scandir(self.data_dir) as it:
+            for entry in it:
+                name = entry.name
+                if (
+                    name.startswith("data_")
+                    and name.endswith(".db")
+                    and entry.is_file(follow_symlinks=False)
+                ):
+                    data_files.append((int(name[5:-3]), Path(entry.path)))
+        data_files.sort()
+        return data_files
+
     def _initialize(self):
         """Initialize or recover the database state."""
         # Find the latest data file
-        data_files = sorted(self.data_dir.glob("data_*.db"))
+        data_files = self._data_files()
         if data_files:
-            self.active_file_id = int(data_files[-1].stem.split("_")[1])
-            self.active_file_path = data_files[-1]
+            self.active_file_id, self.active_file_path = data_files[-1]
             logger.debug("Found existing data file: %s", self.active_file_path)
             self._open_active_file()
             self._build_index()
@@ -109,8 +241,7 @@ class Bitcask:
 
     def _create_new_data_file(self):
         """Create a new data file for writing."""
-        if self.active_file is not None:
-            self.active_file.close()
+        self._close_active_file()
 
         self.active_file_id += 1
         self.active_file_path = self.data_dir / f"data_{self.active_file_id}.db"
@@ -122,21 +253,137 @@ class Bitcask:
         logger.debug("Writing format identifier %r to new file", identifier)
         self.active_file.write(identifier)
         self.active_file.flush()
+        self._write_pos += len(identifier)
         self.active_file_entry_count = 0
         self.active_file_last_write = datetime.now()
 
     def _open_active_file(self):
         """Open the active file for writing."""
-        if self.active_file:
-            self.active_file.close()
+        self._close_active_file()
         self.active_file = open(self.active_file_path, "a+b")
-        self.active_file.seek(0, 2)  # Seek to end
+        self._write_pos = self.active_file.seek(0, 2)  # Seek to end
         logger.debug(
             "Opened active file: %s, size: %d",
             self.active_file_path,
-            self.active_file.tell(),
+            self._write_pos,
         )
 
+    def _read_fd(self, file_id: int) -> _ReadHandle:
+        """Get a cached read-only descriptor and format for a data file.
+
+        Sealed files are also memory-mapped, so reads from them are a slice of
+        the page cache rather than a syscall. The active file is still growing
+        and is read with pread instead.
+
+        Args:
+        ----
+            file_id: The data file to open
+
+        Returns:
+        -------
+            Tuple of (fd, format, mmap) for the file; mmap is None for the
+            active file
+
+        """
+        cached = self._read_fds.get(file_id)
+        if cached is not None:
+            self._read_fds.move_to_end(file_id)
+            fd, format, mm = cached
+            if mm is None and file_id != self.active_file_id:
+                # The file has been sealed by a rotation since it was opened
+                mm = self._map_file(fd)
+                self._read_fds[file_id] = (fd, format, mm)
+            return fd, format, mm
+
+        file_path = self.data_dir / f"data_{file_id}.db"
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            format_byte = _pread(fd, self.FORMAT_ID_SIZE, 0)
+            format = (
+                get_format_by_identifier(format_byte) if format_byte else self.format
+            )
+            mm = self._map_file(fd) if file_id != self.active_file_id else None
+        except BaseException:
+            os.close(fd)
+            raise
+        self._read_fds[file_id] = (fd, format, mm)
+        if len(self._read_fds) > self.MAX_READ_FDS:
+            _, (old_fd, _, old_mm) = self._read_fds.popitem(last=False)
+            if old_mm is not None:
+                old_mm.close()
+            os.close(old_fd)
+        return fd, format, mm
+
+    @staticmethod
+    def _map_file(fd: int) -> Optional[mmap.mmap]:
+        """Memory-map a sealed data file for random reads.
+
+        Args:
+        ----
+            fd: Read-only descriptor of the file
+
+        Returns:
+        -------
+            The read-only map, or None if the file is empty
+
+        """
+        try:
+            mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files cannot be mapped
+            return None
+        if hasattr(mmap, "MADV_RANDOM"):
+            mm.madvise(mmap.MADV_RANDOM)  # Lookups never benefit from readahead
+        return mm
+
+    def _close_read_fds(self) -> None:
+        """Close all cached read descriptors and memory maps."""
+        for fd, _, mm in self._read_fds.values():
+            if mm is not None:
+                mm.close()
+            os.close(fd)
+        self._read_fds.clear()
+
+    def _close_active_file(self) -> None:
+        """Close the active file, committing any pending group-commit writes."""
+        if self.active_file is None:
+            return
+        if self._pending_bytes:
+            self._commit()
+        self.active_file.close()
+        self.active_file = None
+
+    def _commit(self) -> None:
+        """Flush and fsync the active file, ending the current group commit."""
+        self.active_file.flush()
+        os.fsync(self.active_file.fileno())
+        self._pending_bytes = 0
+
+    def _group_commit_loop(self) -> None:
+        """Commit pending writes every group_commit_interval seconds."""
+        while not self._commit_stop.wait(self.group_commit_interval):
+            with self._lock:
+                if self._pending_bytes and self.active_file is not None:
+                    self._commit()
+
+    def _flush_write(self, nbytes: int, durable: bool = False) -> None:
+        """Account for an append to the active file and flush it per sync mode.
+
+        Args:
+        ----
+            nbytes: Number of bytes just written
+            durable: Whether the write must also be fsynced in "always" mode
+
+        """
+        self._write_pos += nbytes
+        if self.sync_mode == "batch":
+            self._pending_bytes += nbytes
+            if self._pending_bytes >= self.group_commit_bytes:
+                self._commit()
+            return
+        self.active_file.flush()
+        if durable and self.sync_mode == "always":
+            os.fsync(self.active_file.fileno())
+
     def _check_rotation(self) -> None:
         """Check if the active file should be rotated based on the rotation strategy.
 
@@ -150,7 +397,7 @@ class Bitcask:
             return
 
         # Get current file size
-        file_size = self.active_file.tell()
+        file_size = self._write_pos
 
         # Get last write time (default to now if not set)
         last_write_time = self.active_file_last_write or datetime.now()
@@ -211,69 +458,54 @@ class Bitcask:
         self.active_file_id = 0
 
         # Get all data files
-        data_files = sorted(
-            [
-                f
-                for f in os.listdir(self.data_dir)
-                if f.startswith("data_") and f.endswith(".db")
-            ]
-        )
+        data_files = self._data_files()
 
         if not data_files:
             # No data files exist, create a new one
             self._create_new_data_file()
             return
 
-        # Process each data file
-        for filename in data_files:
-            file_path = os.path.join(self.data_dir, filename)
-            file_id = int(filename.split("_")[1].split(".")[0])
+        # Process each data file, scanning it through a read-only memory map
+        for file_id, file_path in data_files:
+            filename = file_path.name
             with open(file_path, "rb") as f:
-                # Read format identifier
-                format_byte = f.read(1)
-                if not format_byte:
-                    continue
-
-                format = get_format_by_identifier(format_byte)
-                if not format:
-                    logger.warning(f"Unknown format in {filename}, skipping")
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:  # Empty file
                     continue
-
-                # Read records
-                while True:
-                    try:
-                        key, value, timestamp, record_size, is_tombstone = (
-                            format.read_record(f)
-                        )
-                        if key is None:  # End of file
-                            break
-
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                # Recovery reads each file front to back; ask for aggressive
+                # readahead. The pages are kept, since get() reads them next
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+
+            with mm:
+                format = get_format_by_identifier(mm[: self.FORMAT_ID_SIZE])
+                records = format.scan_records(mm, self.FORMAT_ID_SIZE)
+                try:
+                    for (
+                        key,
+                        timestamp,
+                        record_pos,
+                        record_size,
+                        is_tombstone,
+                    ) in records:
                         if is_tombstone:
                             # Remove from index if it exists
-                            if key in self.index:
-                                del self.index[key]
+                            self.index.pop(key, None)
                             continue
 
                         # Update index only if this is the latest record for the key
                         current_entry = self.index.get(key)
-                        if (
-                            current_entry is None
-                            or current_entry["timestamp"] < timestamp
-                        ):
-                            self.index[key] = {
-                                "file_id": file_id,
-                                "value_size": record_size,
-                                "value_pos": f.tell() - record_size,
-                                "timestamp": timestamp,
-                            }
-                    except Exception as e:
-                        logger.error(f"Error reading record from {filename}: {e}")
-                        break
+                        if current_entry is None or current_entry.timestamp < timestamp:
+                            self.index[key] = IndexEntry(
+                                file_id, record_size, record_pos, timestamp
+                            )
+                except Exception as e:
+                    logger.error(f"Error reading record from {filename}: {e}")
 
         # Set active file to the latest one
         if data_files:
-            self.active_file_id = int(data_files[-1].split("_")[1].split(".")[0])
-            self.active_file_path = self.data_dir / data_files[-1]
+            self.active_file_id, self.active_file_path = data_files[-1]
             self._open_active_file()
         else:
             self._create_new_data_file()
@@ -284,25 +516,22 @@ class Bitcask:
             if self.active_file is None:
                 self._create_new_data_file()
 
-            timestamp = int(time.time() * 1000)  # Current time in milliseconds
+            timestamp = time.time_ns() // 1_000_000  # Current time in milliseconds
             record = self.format.encode_record(key, value, timestamp)
 
             # Write to active file
-            record_pos = self.active_file.tell()
+            record_pos = self._write_pos
             self.active_file.write(record)
-            self.active_file.flush()  # Ensure data is written to disk
+            self._flush_write(len(record))
 
             # Update entry count and last write time
             self.active_file_entry_count += 1
             self.active_file_last_write = datetime.now()
 
             # Update index with current file info
-            self.index[key] = {
-                "file_id": self.active_file_id,
-                "value_size": len(record),
-                "value_pos": record_pos,
-                "timestamp": timestamp,
-            }
+            self.index[key] = IndexEntry(
+                self.active_file_id, len(record), record_pos, timestamp
+            )
             logger.debug(
                 "Wrote record: key=%s, pos=%d, size=%d",
                 key,
@@ -320,41 +549,60 @@ class Bitcask:
                 return None
 
             entry = self.index[key]
-            file_path = self.data_dir / f"data_{entry['file_id']}.db"
+            cache_key = (entry.file_id, entry.value_pos)
+            if cache_key in self._value_cache:
+                self._value_cache.move_to_end(cache_key)
+                return self._value_cache[cache_key]
+
+            if self._pending_bytes and entry.file_id == self.active_file_id:
+                # The record may still sit in the write buffer
+                self.active_file.flush()
 
-            if not file_path.exists():
+            try:
+                fd, format, mm = self._read_fd(entry.file_id)
+            except FileNotFoundError:
+                file_path = self.data_dir / f"data_{entry.file_id}.db"
                 logger.error(f"Data file not found: {file_path}")
                 return None
+            except (OSError, ValueError) as e:
+                logger.error(f"Error opening data file for key {key}: {e}")
+                return None
 
             try:
-                with open(file_path, "rb") as f:
-                    # Read format identifier
-                    format_byte = f.read(1)
-                    if not format_byte:
-                        return None
-
-                    format = get_format_by_identifier(format_byte)
-                    if not format:
-                        logger.warning(f"Unknown format in {file_path}")
-                        return None
-
-                    # Seek to value position
-                    f.seek(entry["value_pos"])
-                    key, value, _, _, is_tombstone = format.read_record(f)
-                    if is_tombstone:
-                        # Remove from index if it's a tombstone
-                        del self.index[key]
-                        return None
-                    return value
-
+                pos = entry.value_pos
+                size = entry.value_size
+                if mm is not None:
+                    data = mm[pos : pos + size]
+                else:
+                    data = _pread(fd, size, pos)
+                _, value, _ = format.decode_record(data)
             except Exception as e:
                 logger.error(f"Error reading value for key {key}: {e}")
                 return None
 
+            if self.value_cache_size:
+                self._value_cache[cache_key] = value
+                if len(self._value_cache) > self.value_cache_size:
+                    self._value_cache.popitem(last=False)
+            return value
+
     def list_keys(self) -> list[str]:
         """List all keys in the database."""
         return list(self.index.keys())
 
+    def iter_keys(self) -> Iterator[str]:
+        """Iterate over all keys in the database without copying them.
+
+        The keys are read straight from the index, so the database must not be
+        written to while the iterator is in use.
+
+        Returns
+        -------
+            Iterator over the keys
+
+        """
+        return iter(self.index)
+
     def delete(self, key: str) -> bool:
         """Delete a key-value pair.
 
@@ -371,13 +619,12 @@ class Bitcask:
             if self.active_file is None:
                 self._create_new_data_file()
 
-            timestamp = int(time.time() * 1000)
+            timestamp = time.time_ns() // 1_000_000
             tombstone = self.format.encode_tombstone(key, timestamp)
 
             # Write tombstone and ensure it's flushed to disk
             self.active_file.write(tombstone)
-            self.active_file.flush()
-            os.fsync(self.active_file.fileno())
+            self._flush_write(len(tombstone), durable=True)
 
             # Remove from index
             del self.index[key]
@@ -385,23 +632,27 @@ class Bitcask:
             return True
 
     def batch_write(self, data: Dict[str, Any]) -> None:
-        """Write multiple key-value pairs in a single operation."""
+        """Write multiple key-value pairs in a single operation.
+
+        All records are encoded into one contiguous buffer and appended to the
+        active file with a single write.
+        """
         with self._lock:
-            timestamp = int(time.time() * 1000)  # Current time in milliseconds
+            if self.active_file is None:
+                self._create_new_data_file()
+
+            timestamp = time.time_ns() // 1_000_000  # Current time in milliseconds
+            buffer = bytearray()
+            base_pos = self._write_pos
             for key, value in data.items():
                 record = self.format.encode_record(key, value, timestamp)
-
-                # Write to active file
-                record_pos = self.active_file.tell()
-                self.active_file.write(record)
+                record_pos = base_pos + len(buffer)
+                buffer += record
 
                 # Update index
-                self.index[key] = {
-                    "file_id": self.active_file_id,
-                    "value_size": len(record),
-                    "value_pos": record_pos,
-                    "timestamp": timestamp,
-                }
+                self.index[key] = IndexEntry(
+                    self.active_file_id, len(record), record_pos, timestamp
+                )
                 logger.debug(
                     "Batch wrote record: key=%s, pos=%d, size=%d",
                     key,
@@ -409,20 +660,74 @@ class Bitcask:
                     len(record),
                 )
 
-            # Flush all writes at once
-            self.active_file.flush()
+            # Write and flush all records at once
+            self.active_file.write(buffer)
+            self._flush_write(len(buffer))
             self.active_file_entry_count += len(data)
             self.active_file_last_write = datetime.now()
 
             # Check if file rotation is needed
             self._check_rotation()
 
+    def batch_delete(self, keys: Iterable[str]) -> int:
+        """Delete multiple keys in a single operation.
+
+        Tombstones for all keys present in the index are appended with a single
+        write, followed by a single fsync in the "always" sync mode.
+
+        Returns
+        -------
+            int: The number of keys that were deleted
+
+        """
+        with self._lock:
+            if self.active_file is None:
+                self._create_new_data_file()
+
+            timestamp = time.time_ns() // 1_000_000
+            buffer = bytearray()
+            deleted = set()
+            for key in keys:
+                if key not in self.index or key in deleted:
+                    continue
+                buffer += self.format.encode_tombstone(key, timestamp)
+                deleted.add(key)
+
+            if not buffer:
+                return 0
+
+            # Write all tombstones and ensure they're flushed to disk
+            self.active_file.write(buffer)
+            self._flush_write(len(buffer), durable=True)
+
+            # Only drop the keys once their tombstones have been written
+            for key in deleted:
+                del self.index[key]
+            logger.debug("Batch deleted %d keys", len(deleted))
+            return len(deleted)
+
+    def sync(self) -> None:
+        """Flush the active file and fsync it to disk."""
+        with self._lock:
+            if self.active_file is None:
+                return
+            self._commit()
+
     def close(self):
         """Close the database and stop any background tasks."""
-        # Stop auto-compaction if running
+        # Stop auto-compaction and the group commit thread if running
         self.stop_auto_compaction()
+        if self._commit_thread is not None:
+            self._commit_stop.set()
+            self._commit_thread.join()
+            self._commit_thread = None
+
+        with self._lock:
+            self._close_read_fds()
 
         if self.active_file:
+            if self.sync_mode != "always":
+                self.sync()
             self.active_file.close()
             self.active_file = None
             logger.debug("Closed database")
@@ -510,12 +815,12 @@ class Bitcask:
         """Delete all data and start fresh."""
         with self._lock:
             # Close any open files
-            if self.active_file:
-                self.active_file.close()
-                self.active_file = None
+            self._close_active_file()
+            self._close_read_fds()
+            self._value_cache.clear()
 
             # Delete all data files
-            for data_file in self.data_dir.glob("data_*.db"):
+            for _, data_file in self._data_files():
                 data_file.unlink()
 
             # Clear the index
@@ -540,15 +845,13 @@ class Bitcask:
 
         """
         with self._lock:
-            data_files = list(self.data_dir.glob("data_*.db"))
-            total_size = sum(f.stat().st_size for f in data_files)
+            data_files = self._data_files()
+            total_size = sum(f.stat().st_size for _, f in data_files)
             live_keys = len(self.index)
 
             # Estimate live data size based on index entries
             # value_size now stores the full serialized record size
-            estimated_live_size = sum(
-                entry["value_size"] for entry in self.index.values()
-            )
+            estimated_live_size = sum(entry.value_size for entry in self.index.values())
 
             # Calculate dead data ratio
             estimated_dead_ratio = 0.0
@@ -642,18 +945,16 @@ class Bitcask:
             # This ensures the original index remains consistent if compaction fails
             new_index = self.index.copy()
 
-            # Close active file
-            if self.active_file:
-                self.active_file.close()
-                self.active_file = None
+            # Close active file and the read descriptors of the files replaced
+            self._close_active_file()
+            self._close_read_fds()
+            self._value_cache.clear()
 
             # Get all current data files
-            old_data_files = sorted(self.data_dir.glob("data_*.db"))
+            old_data_files = self._data_files()
 
             # Create new compacted file
-            compacted_file_id = (
-                max((int(f.stem.split("_")[1]) for f in old_data_files), default=0) + 1
-            )
+            compacted_file_id = old_data_files[-1][0] + 1 if old_data_files else 1
             compacted_file_path = self.data_dir / f"data_{compacted_file_id}.db"
 
             # Track compaction progress
@@ -675,7 +976,7 @@ class Bitcask:
                         # Write all live records in key order for better locality
                         for key in sorted(self.index.keys()):
                             entry = self.index[key]
-                            file_id = entry["file_id"]
+                            file_id = entry.file_id
 
                             # Get or create cached file handle and format
                             if file_id not in file_cache:
@@ -693,7 +994,7 @@ class Bitcask:
                             # Read the current value directly from file
                             try:
                                 # Seek to value position
-                                file_handle.seek(entry["value_pos"])
+                                file_handle.seek(entry.value_pos)
 
                                 # Read the record using the appropriate format
                                 record_key, value, record_timestamp, _, is_tombstone = (
@@ -705,7 +1006,7 @@ class Bitcask:
                                     continue
 
                                 # Encode and write the record
-                                timestamp = entry["timestamp"]
+                                timestamp = entry.timestamp
                                 record = self.format.encode_record(
                                     key, value, timestamp
                                 )
@@ -713,12 +1014,12 @@ class Bitcask:
                                 compacted_file.write(record)
 
                                 # Update the new index copy to point to new location
-                                new_index[key] = {
-                                    "file_id": compacted_file_id,
-                                    "value_size": entry["value_size"],
-                                    "value_pos": record_pos,
-                                    "timestamp": timestamp,
-                                }
+                                new_index[key] = IndexEntry(
+                                    compacted_file_id,
+                                    len(record),
+                                    record_pos,
+                                    timestamp,
+                                )
 
                                 records_written += 1
                                 bytes_written += len(record)
@@ -752,7 +1053,7 @@ class Bitcask:
 
                 # Remove old data files
                 removed_files = []
-                for old_file in old_data_files:
+                for _, old_file in old_data_files:
                     try:
                         old_file.unlink()
                         removed_files.append(str(old_file))
@@ -808,8 +1109,7 @@ class Bitcask:
 
                 # Restore active file
                 if old_data_files:
-                    self.active_file_id = int(old_data_files[-1].stem.split("_")[1])
-                    self.active_file_path = old_data_files[-1]
+                    self.active_file_id, self.active_file_path = old_data_files[-1]
                     self._open_active_file()
 
                 logger.error("Compaction failed: %s", e)
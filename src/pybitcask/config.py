@@ -4,7 +4,51 @@ import json
 import os
 import platform
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:  # orjson is optional; fall back to the stdlib
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+# Parsed config files keyed by path, with the (st_mtime_ns, st_size) they were
+# parsed at; an entry is reused only while the file is unchanged on disk
+_CONFIG_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+def load_config_file(path: Path) -> Dict[str, Any]:
+    """Load a JSON config file, reusing the parsed result while it is unchanged.
+
+    Args:
+    ----
+        path: Path to the config file
+
+    Returns:
+    -------
+        The parsed configuration
+
+    """
+    st = os.stat(path)
+    cached = _CONFIG_CACHE.get(str(path))
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    with open(path, "rb") as f:
+        data = _loads(f.read())
+    _CONFIG_CACHE[str(path)] = (st.st_mtime_ns, st.st_size, data)
+    return data
 
 
 class BitcaskConfig:
@@ -49,8 +93,7 @@ class BitcaskConfig:
         """Load configuration from file."""
         try:
             if self.config_file.exists():
-                with open(self.config_file) as f:
-                    self.config_data = json.load(f)
+                self.config_data = load_config_file(self.config_file)
             else:
                 self.config_data = {
                     "data_dir": str(self.default_data_dir),
@@ -65,11 +108,30 @@ class BitcaskConfig:
             }
 
     def _save_config(self) -> None:
-        """Save configuration to file."""
+        """Save configuration to file, atomically and only if it changed."""
         try:
+            data = _dumps(self.config_data)
+            try:
+                if self.config_file.read_bytes() == data:
+                    return  # Already up to date on disk
+            except FileNotFoundError:
+                pass
+
+            # Write a temporary file and rename it over the config, so a crash
+            # never leaves a partially written config behind
             self.config_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.config_file, "w") as f:
-                json.dump(self.config_data, f, indent=2)
+            tmp_file = self.config_file.with_suffix(".json.tmp")
+            with open(tmp_file, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
+            st = os.stat(self.config_file)
+            _CONFIG_CACHE[str(self.config_file)] = (
+                st.st_mtime_ns,
+                st.st_size,
+                self.config_data,
+            )
         except Exception as e:
             print(f"Warning: Could not save config file: {e}")
 
@@ -1,11 +1,102 @@
 """Data format implementations for Bitcask."""
 
+import base64
+import io
 import json
+import struct
 from abc import ABC, abstractmethod
-from typing import Any, Tuple
+from typing import Any, Iterator, Tuple
 
 from pybitcask.proto.record_pb2 import Record
 
+# Types orjson and json.dumps encode identically; subclasses are excluded
+_PLAIN_SCALARS = frozenset((str, int, bool, type(None)))
+
+# orjson refuses to nest deeper than this
+_MAX_ORJSON_DEPTH = 254
+
+
+def _is_plain_json(obj: Any, depth: int = 0) -> bool:
+    """Check whether orjson would encode a value exactly like json.dumps.
+
+    orjson writes NaN and Infinity as null and natively serializes types such
+    as datetime and UUID that json.dumps rejects, so only finite floats and
+    builtin containers, strings, integers, booleans and None qualify.
+
+    Args:
+    ----
+        obj: The value to check
+        depth: Nesting depth of ``obj`` within the top-level value
+
+    Returns:
+    -------
+        True if the value may be encoded with orjson
+
+    """
+    cls = type(obj)
+    if cls is dict:
+        if depth > _MAX_ORJSON_DEPTH:
+            return False
+        for key in obj:
+            if type(key) is not str:
+                return False
+        items = obj.values()
+    elif cls is list or cls is tuple:
+        if depth > _MAX_ORJSON_DEPTH:
+            return False
+        items = obj
+    elif cls is float:
+        return obj - obj == 0.0  # False for NaN and infinities
+    else:
+        return cls in _PLAIN_SCALARS
+
+    for item in items:
+        cls = type(item)
+        if cls in _PLAIN_SCALARS:
+            continue
+        if cls is float:
+            if item - item != 0.0:
+                return False
+        elif not _is_plain_json(item, depth + 1):
+            return False
+    return True
+
+
+# Values are encoded with orjson when it is installed. Decoding stays on the
+# stdlib parser, which reads UTF-8 bytes directly; orjson would silently turn
+# integers wider than 64 bits into floats. Index scans only need keys and
+# timestamps, so they may use orjson for parsing
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        if _is_plain_json(obj):
+            try:
+                return orjson.dumps(obj)
+            except TypeError:
+                pass  # Integers wider than 64 bits
+        # Everything else keeps the stdlib's behaviour: NaN and Infinity are
+        # written as such, non-str keys are converted and unsupported types
+        # such as datetime raise TypeError
+        return json.dumps(obj).encode("utf-8")
+
+    def _scan_loads(data: bytes) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN and Infinity, which json.dumps writes but orjson rejects
+            return json.loads(data)
+
+except ImportError:  # orjson is optional; fall back to the stdlib
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _scan_loads = json.loads
+
+
+_loads = json.loads
+
 
 class DataFormat(ABC):
     """Abstract base class for data formats."""
@@ -50,10 +141,41 @@ class DataFormat(ABC):
         """
         pass
 
+    def scan_records(
+        self, data: bytes, offset: int = 0
+    ) -> Iterator[Tuple[str, int, int, int, bool]]:
+        """Scan the records in a buffer without decoding their values.
+
+        Used to rebuild the index, which only needs each record's key,
+        timestamp and location. Subclasses override this with a parser that
+        works on the buffer directly.
+
+        Args:
+        ----
+            data: Buffer holding the file contents, e.g. an mmap
+            offset: Position of the first record in the buffer
+
+        Returns:
+        -------
+            Iterator of (key, timestamp, record_pos, record_size, is_tombstone)
+
+        """
+        file = io.BytesIO(data)
+        file.seek(offset)
+        while True:
+            pos = file.tell()
+            key, _, timestamp, record_size, is_tombstone = self.read_record(file)
+            if key is None:
+                return
+            yield key, timestamp, pos, record_size, is_tombstone
+
 
 class ProtoFormat(DataFormat):
     """Protocol Buffers format implementation."""
 
+    # Size prefix in front of every serialized record
+    _SIZE_PREFIX = struct.Struct(">I")
+
     def get_format_identifier(self) -> bytes:
         """Get the format identifier byte."""
         return self.FORMAT_PROTO
@@ -62,7 +184,12 @@ class ProtoFormat(DataFormat):
         """Encode a record into protobuf format."""
         record = Record()
         record.key = key
-        record.value = json.dumps(value).encode("utf-8")
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            # Raw bytes are stored as-is, skipping JSON serialization
+            record.value = bytes(value)
+            record.raw = True
+        else:
+            record.value = _dumps(value)
         record.timestamp = timestamp
         record.deleted = False
 
@@ -70,7 +197,7 @@ class ProtoFormat(DataFormat):
         proto_data = record.SerializeToString()
 
         # Add size prefix (4 bytes, big-endian)
-        size_prefix = len(proto_data).to_bytes(4, byteorder="big")
+        size_prefix = self._SIZE_PREFIX.pack(len(proto_data))
 
         return size_prefix + proto_data
 
@@ -84,8 +211,7 @@ class ProtoFormat(DataFormat):
             record.ParseFromString(proto_data)
             if record.deleted:
                 raise ValueError("Record is a tombstone")
-            value = json.loads(record.value.decode("utf-8"))
-            return record.key, value, record.timestamp
+            return record.key, self._decode_value(record), record.timestamp
         except Exception as err:
             raise ValueError(f"Failed to decode protobuf record: {str(err)}") from err
 
@@ -100,7 +226,7 @@ class ProtoFormat(DataFormat):
         proto_data = record.SerializeToString()
 
         # Add size prefix (4 bytes, big-endian)
-        size_prefix = len(proto_data).to_bytes(4, byteorder="big")
+        size_prefix = self._SIZE_PREFIX.pack(len(proto_data))
 
         return size_prefix + proto_data
 
@@ -118,7 +244,7 @@ class ProtoFormat(DataFormat):
             if not size_bytes or len(size_bytes) < 4:
                 return None, None, None, None, False
 
-            size = int.from_bytes(size_bytes, byteorder="big")
+            (size,) = self._SIZE_PREFIX.unpack(size_bytes)
 
             # Read the protobuf message
             data = file.read(size)
@@ -131,11 +257,46 @@ class ProtoFormat(DataFormat):
             if record.deleted:
                 return record.key, None, record.timestamp, size + 4, True
 
-            value = json.loads(record.value.decode("utf-8"))
+            value = self._decode_value(record)
             return record.key, value, record.timestamp, size + 4, False
         except Exception as e:
             raise ValueError(f"Failed to read protobuf record: {str(e)}") from e
 
+    def scan_records(
+        self, data: bytes, offset: int = 0
+    ) -> Iterator[Tuple[str, int, int, int, bool]]:
+        """Scan size-prefixed protobuf records without decoding their values.
+
+        Args:
+        ----
+            data: Buffer holding the file contents, e.g. an mmap
+            offset: Position of the first record in the buffer
+
+        Returns:
+        -------
+            Iterator of (key, timestamp, record_pos, record_size, is_tombstone)
+
+        """
+        unpack_size = self._SIZE_PREFIX.unpack_from
+        record = Record()
+        pos = offset
+        end = len(data)
+        while pos + 4 <= end:
+            (size,) = unpack_size(data, pos)
+            start = pos + 4
+            if start + size > end:
+                return  # Truncated record at the end of the file
+            record.ParseFromString(data[start : start + size])
+            yield record.key, record.timestamp, pos, size + 4, record.deleted
+            pos = start + size
+
+    @staticmethod
+    def _decode_value(record: Record) -> Any:
+        """Decode the value of a protobuf record."""
+        if record.raw:
+            return record.value
+        return _loads(record.value)
+
 
 class JsonFormat(DataFormat):
     """JSON format implementation for human-readable storage."""
@@ -147,20 +308,24 @@ class JsonFormat(DataFormat):
     def encode_record(self, key: str, value: Any, timestamp: int) -> bytes:
         """Encode a record into JSON format."""
         record = {"key": key, "value": value, "timestamp": timestamp}
-        return (json.dumps(record) + "\n").encode("utf-8")
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            # JSON has no bytes type, so raw values are stored base64-encoded
+            record["value"] = base64.b64encode(value).decode("ascii")
+            record["raw"] = True
+        return _dumps(record) + b"\n"
 
     def decode_record(self, data: bytes) -> Tuple[str, Any, int]:
         """Decode JSON format into a record."""
         try:
-            record = json.loads(data.decode("utf-8").strip())
-            return record["key"], record["value"], record["timestamp"]
-        except (json.JSONDecodeError, KeyError) as err:
+            record = _loads(data)
+            return record["key"], self._decode_value(record), record["timestamp"]
+        except (ValueError, KeyError) as err:
             raise ValueError(f"Failed to decode JSON record: {str(err)}") from err
 
     def encode_tombstone(self, key: str, timestamp: int) -> bytes:
         """Encode a tombstone in JSON format."""
         record = {"key": key, "value": None, "timestamp": timestamp, "deleted": True}
-        return (json.dumps(record) + "\n").encode("utf-8")
+        return _dumps(record) + b"\n"
 
     def read_record(self, file) -> Tuple[str, Any, int, int, bool]:
         """Read a record from a file in JSON format.
@@ -175,14 +340,52 @@ class JsonFormat(DataFormat):
             return None, None, None, None, False
 
         try:
-            record = json.loads(line)
+            record = _loads(line)
             is_tombstone = record.get("deleted", False)
             if is_tombstone:
                 return record["key"], None, record["timestamp"], len(line), True
-            return record["key"], record["value"], record["timestamp"], len(line), False
+            value = self._decode_value(record)
+            return record["key"], value, record["timestamp"], len(line), False
         except Exception as e:
             raise ValueError(f"Failed to read JSON record: {str(e)}") from e
 
+    def scan_records(
+        self, data: bytes, offset: int = 0
+    ) -> Iterator[Tuple[str, int, int, int, bool]]:
+        """Scan newline-delimited JSON records.
+
+        Args:
+        ----
+            data: Buffer holding the file contents, e.g. an mmap
+            offset: Position of the first record in the buffer
+
+        Returns:
+        -------
+            Iterator of (key, timestamp, record_pos, record_size, is_tombstone)
+
+        """
+        pos = offset
+        end = len(data)
+        while pos < end:
+            newline = data.find(b"\n", pos)
+            line_end = end if newline == -1 else newline + 1
+            record = _scan_loads(data[pos:line_end])
+            yield (
+                record["key"],
+                record["timestamp"],
+                pos,
+                line_end - pos,
+                record.get("deleted", False),
+            )
+            pos = line_end
+
+    @staticmethod
+    def _decode_value(record: dict) -> Any:
+        """Decode the value of a JSON record."""
+        if record.get("raw", False):
+            return base64.b64decode(record["value"])
+        return record["value"]
+
 
 def get_format_by_identifier(identifier: bytes = None) -> DataFormat:
     """Get the appropriate format class based on the identifier byte.
@@ -19,7 +19,7 @@ _sym_db = _symbol_database.Default()
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\x0crecord.proto\x12\x0fpybitcask.proto"H\n\x06Record\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c\x12\x11\n\ttimestamp\x18\x03 \x01(\x03\x12\x0f\n\x07\x64\x65leted\x18\x04 \x01(\x08\x62\x06proto3'
+    b'\n\x0crecord.proto\x12\x0fpybitcask.proto"U\n\x06Record\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c\x12\x11\n\ttimestamp\x18\x03 \x01(\x03\x12\x0f\n\x07deleted\x18\x04 \x01(\x08\x12\x0b\n\x03raw\x18\x05 \x01(\x08b\x06proto3'
 )
 
 _globals = globals()
@@ -28,5 +28,5 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, "record_pb2", _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
     DESCRIPTOR._loaded_options = None
     _globals["_RECORD"]._serialized_start = 33
-    _globals["_RECORD"]._serialized_end = 105
+    _globals["_RECORD"]._serialized_end = 118
 # @@protoc_insertion_point(module_scope)
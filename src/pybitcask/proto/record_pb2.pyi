@@ -18,10 +18,13 @@ class Record(google.protobuf.message.Message):
     VALUE_FIELD_NUMBER: builtins.int
     TIMESTAMP_FIELD_NUMBER: builtins.int
     DELETED_FIELD_NUMBER: builtins.int
+    RAW_FIELD_NUMBER: builtins.int
     key: builtins.str
     value: builtins.bytes
     timestamp: builtins.int
     deleted: builtins.bool
+    raw: builtins.bool
+    """True when value holds raw bytes rather than a JSON document"""
     def __init__(
         self,
         *,
@@ -29,6 +32,7 @@ class Record(google.protobuf.message.Message):
         value: builtins.bytes = ...,
         timestamp: builtins.int = ...,
         deleted: builtins.bool = ...,
+        raw: builtins.bool = ...,
     ) -> None: ...
     def ClearField(
         self,
@@ -37,6 +41,8 @@ class Record(google.protobuf.message.Message):
             b"deleted",
             "key",
             b"key",
+            "raw",
+            b"raw",
             "timestamp",
             b"timestamp",
             "value",
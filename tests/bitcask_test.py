@@ -2,10 +2,13 @@
 
 # -*- coding: utf-8 -*-
 import logging
+import math
 import shutil
 import tempfile
 import unittest
+from datetime import datetime
 from pathlib import Path
+from unittest import mock
 
 from pybitcask import (
     Bitcask,
@@ -96,6 +99,67 @@ class TestBitcask(unittest.TestCase):
         self.assertEqual(new_db.get("key2"), "value2")
         new_db.close()
 
+    def test_truncated_record_is_ignored_on_reopen(self):
+        """Test that a partially written last record does not break recovery."""
+        for debug_mode in (False, True):
+            data_dir = self.test_dir / f"debug_{debug_mode}"
+            db = Bitcask(str(data_dir), debug_mode=debug_mode)
+            db.put("key1", {"n": 1})
+            db.put("key2", "value2")
+            db.close()
+
+            # Simulate a crash in the middle of appending a record
+            with open(data_dir / "data_1.db", "ab") as f:
+                f.write(b"\x00\x00\x01\x00partial")
+
+            db = Bitcask(str(data_dir), debug_mode=debug_mode)
+            self.assertEqual(db.get("key1"), {"n": 1})
+            self.assertEqual(db.get("key2"), "value2")
+            self.assertEqual(len(db.list_keys()), 2)
+            db.close()
+
+    def test_non_finite_floats_survive_reopen(self):
+        """Test that JSON records holding NaN do not hide later records."""
+        data_dir = self.test_dir / "nan"
+        db = Bitcask(str(data_dir), debug_mode=True)
+        db.put("key1", "value1")
+        db.put("nan", {"reading": float("nan")})
+        db.put("inf", float("inf"))
+        db.put("key2", "value2")
+        db.close()
+
+        db = Bitcask(str(data_dir), debug_mode=True)
+        self.assertEqual(sorted(db.list_keys()), ["inf", "key1", "key2", "nan"])
+        self.assertTrue(math.isnan(db.get("nan")["reading"]))
+        self.assertEqual(db.get("inf"), float("inf"))
+        self.assertEqual(db.get("key2"), "value2")
+        db.close()
+
+    def test_compaction_reencodes_records_in_current_format(self):
+        """Test that compaction indexes the size of each re-encoded record."""
+        data_dir = self.test_dir / "reencode"
+        db = Bitcask(str(data_dir), debug_mode=True)
+        db.put("key1", {"nested": [1, 2, 3]})
+        db.put("key2", "value2")
+        db.close()
+
+        # Compacting JSON records into protobuf changes every record's length
+        db = Bitcask(str(data_dir), debug_mode=False)
+        db.compact(force=True)
+        self.assertEqual(db.get("key1"), {"nested": [1, 2, 3]})
+        self.assertEqual(db.get("key2"), "value2")
+        db.close()
+
+    def test_unreadable_data_file_returns_none(self):
+        """Test that an error opening a data file is logged, not raised."""
+        self.db.put("key1", "value1")
+        data_file = self.test_dir / "data_1.db"
+        data_file.unlink()
+        data_file.mkdir()  # Opens fine, but every read fails
+        self.assertIsNone(self.db.get("key1"))
+        self.assertEqual(len(self.db._read_fds), 0)
+        data_file.rmdir()
+
     def test_batch_write(self):
         """Test batch write operation."""
         data = {"key3": "value3", "key4": "value4"}
@@ -103,6 +167,140 @@ class TestBitcask(unittest.TestCase):
         self.assertEqual(self.db.get("key3"), "value3")
         self.assertEqual(self.db.get("key4"), "value4")
 
+    def test_bytes_values(self):
+        """Test that raw bytes values round-trip in both storage formats."""
+        self.db.close()
+        for debug_mode in (False, True):
+            data_dir = self.test_dir / f"debug_{debug_mode}"
+            db = Bitcask(str(data_dir), debug_mode=debug_mode)
+            db.put("raw", b"\x00\x01binary\xff")
+            db.put("json", "text")
+            self.assertEqual(db.get("raw"), b"\x00\x01binary\xff")
+            self.assertEqual(db.get("json"), "text")
+            db.close()
+
+            # Values must be recovered unchanged after a reopen
+            db = Bitcask(str(data_dir), debug_mode=debug_mode)
+            self.assertEqual(db.get("raw"), b"\x00\x01binary\xff")
+            self.assertEqual(db.get("json"), "text")
+            db.close()
+        self.db = Bitcask(str(self.test_dir))
+
+    def test_json_value_semantics(self):
+        """Test that values are encoded exactly as json.dumps would."""
+        for debug_mode in (False, True):
+            db = Bitcask(
+                str(self.test_dir / f"debug_{debug_mode}"), debug_mode=debug_mode
+            )
+            db.put("nan", float("nan"))
+            db.put("inf", [1.0, float("inf"), float("-inf")])
+            db.put("int_keys", {1: "a", "2": "b"})
+            self.assertTrue(math.isnan(db.get("nan")))
+            self.assertEqual(db.get("inf"), [1.0, float("inf"), float("-inf")])
+            self.assertEqual(db.get("int_keys"), {"1": "a", "2": "b"})
+
+            # Types json.dumps rejects must not be stored
+            with self.assertRaises(TypeError):
+                db.put("when", datetime(2024, 1, 1))
+            self.assertIsNone(db.get("when"))
+            db.close()
+
+    def test_manual_sync(self):
+        """Test that manual sync mode persists writes on sync and close."""
+        self.db.close()
+        self.db = Bitcask(str(self.test_dir), sync="manual")
+        self.db.put("key1", "value1")
+        self.db.delete("key1")
+        self.db.put("key2", "value2")
+        self.db.sync()
+        self.db.close()
+
+        self.db = Bitcask(str(self.test_dir))
+        self.assertIsNone(self.db.get("key1"))
+        self.assertEqual(self.db.get("key2"), "value2")
+
+        with self.assertRaises(ValueError):
+            Bitcask(str(self.test_dir), sync="never")
+
+    def test_group_commit(self):
+        """Test that batch sync mode reads back and persists buffered writes."""
+        self.db.close()
+        self.db = Bitcask(str(self.test_dir), sync="batch", group_commit_interval=60)
+        self.db.put("key1", "value1")
+        self.db.put("key2", "value2")
+        self.db.delete("key2")
+        # Reads must see records still pending in the group commit
+        self.assertEqual(self.db.get("key1"), "value1")
+        self.assertIsNone(self.db.get("key2"))
+        self.db.close()
+
+        self.db = Bitcask(str(self.test_dir))
+        self.assertEqual(self.db.get("key1"), "value1")
+        self.assertIsNone(self.db.get("key2"))
+
+        with self.assertRaises(ValueError):
+            Bitcask(str(self.test_dir), sync="batch", group_commit_bytes=0)
+
+    def test_value_cache(self):
+        """Test that cached values follow overwrites, deletes and compaction."""
+        self.db.close()
+        self.db = Bitcask(str(self.test_dir), value_cache_size=2)
+        self.db.put("key1", {"n": 1})
+        self.assertIs(self.db.get("key1"), self.db.get("key1"))
+
+        self.db.put("key1", {"n": 2})
+        self.assertEqual(self.db.get("key1"), {"n": 2})
+        self.db.batch_write({"key2": "value2", "key3": "value3"})
+        self.db.get("key2")
+        self.db.get("key3")
+        self.assertEqual(len(self.db._value_cache), 2)
+
+        self.db.delete("key2")
+        self.assertIsNone(self.db.get("key2"))
+        self.db.compact(force=True)
+        self.assertEqual(len(self.db._value_cache), 0)
+        self.assertEqual(self.db.get("key1"), {"n": 2})
+        self.assertEqual(self.db.get("key3"), "value3")
+
+        with self.assertRaises(ValueError):
+            Bitcask(str(self.test_dir), value_cache_size=-1)
+
+    def test_batch_delete(self):
+        """Test batch delete operation."""
+        self.db.batch_write({"key1": "value1", "key2": "value2", "key3": "value3"})
+
+        deleted = self.db.batch_delete(["key1", "key2", "missing"])
+        self.assertEqual(deleted, 2)
+        self.assertIsNone(self.db.get("key1"))
+        self.assertIsNone(self.db.get("key2"))
+        self.assertEqual(self.db.get("key3"), "value3")
+
+        # Tombstones must survive a reopen
+        self.db.close()
+        self.db = Bitcask(str(self.test_dir))
+        self.assertIsNone(self.db.get("key1"))
+        self.assertEqual(self.db.list_keys(), ["key3"])
+
+    def test_batch_delete_keeps_keys_when_write_fails(self):
+        """Test that a failed batch delete leaves the index untouched."""
+        self.db.batch_write({"key1": "value1", "key2": "value2"})
+        with mock.patch.object(self.db, "_flush_write", side_effect=OSError("disk")):
+            with self.assertRaises(OSError):
+                self.db.batch_delete(["key1", "key1", "key2"])
+        self.assertEqual(self.db.get("key1"), "value1")
+        self.assertEqual(self.db.get("key2"), "value2")
+
+        self.assertEqual(self.db.batch_delete(["key1", "key1"]), 1)
+        self.assertIsNone(self.db.get("key1"))
+
+    def test_iter_keys(self):
+        """Test iterating over keys without building a list."""
+        self.assertEqual(list(self.db.iter_keys()), [])
+        self.db.batch_write({"key1": "value1", "key2": "value2"})
+        self.db.delete("key1")
+        self.assertEqual(list(self.db.iter_keys()), self.db.list_keys())
+        self.assertEqual(list(self.db.iter_keys()), ["key2"])
+
 
 class TestRotation(unittest.TestCase):
     """Test suite for file rotation functionality."""
@@ -211,6 +409,44 @@ class TestRotation(unittest.TestCase):
 
         db2.close()
 
+    def test_reads_across_more_files_than_open_limit(self):
+        """Test reads when there are more data files than cached descriptors."""
+        rotation = EntryCountRotation(max_entries=1)
+        db = Bitcask(str(self.test_dir), rotation_strategy=rotation)
+        db.MAX_READ_FDS = 2
+
+        for i in range(6):
+            db.put(f"key{i}", f"value{i}")
+        for _ in range(2):
+            for i in range(6):
+                self.assertEqual(db.get(f"key{i}"), f"value{i}")
+
+        # Compaction replaces every file the cached descriptors point at
+        db.compact(force=True)
+        for i in range(6):
+            self.assertEqual(db.get(f"key{i}"), f"value{i}")
+
+        db.close()
+
+    def test_rotation_replays_files_in_numeric_order(self):
+        """Test that data_10.db is replayed after data_2.db on reopen."""
+        rotation = EntryCountRotation(max_entries=1)
+        db = Bitcask(str(self.test_dir), rotation_strategy=rotation)
+
+        # The tombstone lands in an early file, the re-put in data_10.db
+        db.put("key", "old")
+        db.delete("key")
+        for i in range(7):
+            db.put(f"filler{i}", i)
+        db.put("key", "new")
+        self.assertTrue((self.test_dir / "data_10.db").exists())
+        db.close()
+
+        db2 = Bitcask(str(self.test_dir))
+        self.assertEqual(db2.get("key"), "new")
+        self.assertEqual(db2.active_file_path.name, "data_10.db")
+        db2.close()
+
 
 class TestAutoCompaction(unittest.TestCase):
     """Test suite for automatic compaction scheduling."""
@@ -0,0 +1,58 @@
+"""Unit tests for the PyBitcask REST API server."""
+
+# -*- coding: utf-8 -*-
+import base64
+import logging
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from pybitcask import Bitcask
+
+try:
+    from fastapi.testclient import TestClient
+    from pybitcask_cli import server
+except ImportError:  # The server extra is not installed
+    server = None
+
+# Disable all logging before importing Bitcask
+logging.disable(logging.CRITICAL)
+
+
+@unittest.skipIf(server is None, "server dependencies are not installed")
+class TestServer(unittest.TestCase):
+    """Test suite for the REST API endpoints."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.test_dir = Path(tempfile.mkdtemp(prefix="bitcask-server-test-"))
+        self.db = Bitcask(str(self.test_dir))
+        server.initialize_database(str(self.test_dir), database=self.db)
+        self.client = TestClient(server.app)
+
+    def tearDown(self):
+        """Clean up test fixtures after each test method."""
+        server.cleanup_database()
+        self.db.close()
+        shutil.rmtree(self.test_dir)
+
+    def test_get_bulk_encodes_bytes_values(self):
+        """Test that raw bytes values are returned base64-encoded in bulk gets."""
+        self.db.put("raw", b"\xff\x00binary")
+        self.db.put("text", "value")
+
+        response = self.client.post(
+            "/get_bulk", json={"keys": ["raw", "text", "missing", "raw"]}
+        )
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["raw_keys"], ["raw"])
+        self.assertEqual(base64.b64decode(body["values"]["raw"]), b"\xff\x00binary")
+        self.assertEqual(body["values"]["text"], "value")
+        self.assertIsNone(body["values"]["missing"])
+        self.assertEqual(body["found"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()